@@ -8,6 +8,7 @@ import time
 
 import structlog
 import uvicorn
+from telegram import Update
 
 from navaar.api.server import create_app
 from navaar.config import Settings
@@ -93,6 +94,7 @@ async def run() -> None:
     downloader = YTDownloader(
         cookies_file=settings.ytdlp_cookies_file,
         max_upload_mb=settings.telegram_max_upload_mb,
+        max_concurrent=settings.ytdlp_max_concurrent,
     )
 
     # Spotify client (conditional)
@@ -129,7 +131,7 @@ async def run() -> None:
     tg_to_yt = TgToYtSync(track_repo, sync_log, tg_client, yt_client)
     yt_to_tg = YtToTgSync(
         track_repo, sync_state, sync_log, tg_client, yt_client, downloader,
-        sp_enabled=sp_enabled,
+        sp_enabled=sp_enabled, max_concurrent=settings.ytdlp_max_concurrent,
     )
 
     sync_modules: dict[str, object] = {
@@ -149,7 +151,8 @@ async def run() -> None:
 
         tg_to_sp = TgToSpSync(track_repo, sync_log, tg_client, sp_client)
         sp_to_tg = SpToTgSync(
-            track_repo, sync_state, sync_log, tg_client, sp_client, yt_client, downloader
+            track_repo, sync_state, sync_log, tg_client, sp_client, yt_client, downloader,
+            max_concurrent=settings.ytdlp_max_concurrent,
         )
         yt_to_sp = YtToSpSync(track_repo, sync_log, yt_client, sp_client)
         sp_to_yt = SpToYtSync(track_repo, sync_log, sp_client, yt_client)
@@ -237,6 +240,8 @@ async def run() -> None:
         start_time=start_time,
         intervals=intervals,
         stale_multiplier=settings.readiness_stale_multiplier,
+        telegram_app=tg_app if settings.telegram_webhook_url else None,
+        telegram_webhook_secret=settings.telegram_webhook_secret_token,
     )
     api_config = uvicorn.Config(
         api_app, host="0.0.0.0", port=settings.api_port, log_level="warning"
@@ -260,7 +265,19 @@ async def run() -> None:
     # Start all components
     await tg_app.initialize()
     await tg_app.start()
-    await tg_app.updater.start_polling(drop_pending_updates=True)
+    if settings.telegram_webhook_url:
+        # Updates arrive on the API server's webhook route (same port), so the
+        # PTB updater stays idle. Telegram only pushes to HTTPS URLs.
+        await tg_app.bot.set_webhook(
+            url=settings.telegram_webhook_url,
+            secret_token=settings.telegram_webhook_secret_token,
+            allowed_updates=Update.ALL_TYPES,
+            drop_pending_updates=True,
+        )
+        logger.info("telegram_webhook_set", url=settings.telegram_webhook_url)
+    else:
+        # start_polling() clears any previously registered webhook itself.
+        await tg_app.updater.start_polling(drop_pending_updates=True)
     # Populate the Telegram `/` command menu (setMyCommands) for admins.
     await bot_app_builder.set_command_menu()
 
@@ -278,7 +295,8 @@ async def run() -> None:
     UP.set(0)
 
     # Stop components in order
-    await tg_app.updater.stop()
+    if tg_app.updater.running:
+        await tg_app.updater.stop()
     await tg_app.stop()
     await tg_app.shutdown()
     api_server.should_exit = True
@@ -288,6 +306,8 @@ async def run() -> None:
         task.cancel()
     await asyncio.gather(*tasks, return_exceptions=True)
 
+    yt_client.close()
+    await tg_client.close()
     await close_db()
     logger.info("navaar_stopped")
 
@@ -1,15 +1,23 @@
 from __future__ import annotations
 
+import hmac
 import json
 import time
+from typing import TYPE_CHECKING
 
-from fastapi import FastAPI, Query
+from fastapi import FastAPI, Query, Request
 from fastapi.responses import JSONResponse, PlainTextResponse
 from prometheus_client import generate_latest
+from telegram import Update
 
 from navaar.db.repository import SyncLogRepository, SyncStateRepository, TrackRepository
 from navaar.metrics import ALL_DIRECTIONS, UP, UPTIME_SECONDS
 
+if TYPE_CHECKING:
+    from telegram.ext import Application
+
+TELEGRAM_WEBHOOK_PATH = "/telegram/webhook"
+
 
 def create_app(
     track_repo: TrackRepository | None = None,
@@ -18,6 +26,8 @@ def create_app(
     start_time: float | None = None,
     intervals: dict[str, int] | None = None,
     stale_multiplier: int = 5,
+    telegram_app: Application | None = None,
+    telegram_webhook_secret: str = "",
 ) -> FastAPI:
     app = FastAPI(title="Navaar API", docs_url="/docs", redoc_url=None)
     _start = start_time or time.time()
@@ -67,6 +77,34 @@ def create_app(
             media_type="text/plain; version=0.0.4; charset=utf-8",
         )
 
+    # ── Telegram webhook ──────────────────────────────────────────────
+
+    if telegram_app is not None:
+
+        @app.post(TELEGRAM_WEBHOOK_PATH)
+        async def telegram_webhook(request: Request) -> JSONResponse:
+            # Webhook mode: Telegram pushes each update here instead of the bot
+            # long-polling getUpdates. Hand it to the PTB application's queue so
+            # the regular handlers run exactly as they do under polling.
+            # Fail closed: without a configured secret nothing is accepted (Settings
+            # refuses a webhook URL without one, so that's a wiring bug, not a mode).
+            sent = request.headers.get("X-Telegram-Bot-Api-Secret-Token", "")
+            if not telegram_webhook_secret or not hmac.compare_digest(
+                sent.encode(), telegram_webhook_secret.encode()
+            ):
+                return JSONResponse({"ok": False}, status_code=403)
+            # Garbage bodies (not JSON, not an object, not an Update) are the
+            # sender's fault: answer 400 rather than surfacing a server error.
+            try:
+                payload = await request.json()
+                if not isinstance(payload, dict):
+                    raise TypeError("update body must be a JSON object")
+                update = Update.de_json(payload, telegram_app.bot)
+            except (ValueError, TypeError):
+                return JSONResponse({"ok": False}, status_code=400)
+            await telegram_app.update_queue.put(update)
+            return JSONResponse({"ok": True})
+
     # ── JSON API ──────────────────────────────────────────────────────
 
     def _track_to_dict(t) -> dict:
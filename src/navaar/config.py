@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from pydantic import Field
+from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -17,6 +17,14 @@ class Settings(BaseSettings):
     # Reply to each track in the channel with a live status card (origin, per-
     # platform sync status, links). Set False to disable the channel replies.
     track_cards_enabled: bool = True
+    # Receive updates via a Telegram webhook instead of long polling. When set, it
+    # must be the public HTTPS URL that routes to the API server's
+    # /telegram/webhook path (shares api_port). Empty = long polling.
+    telegram_webhook_url: str = ""
+    # Echoed by Telegram in X-Telegram-Bot-Api-Secret-Token on every webhook call;
+    # requests without it are rejected. Required whenever telegram_webhook_url is
+    # set: the route is public and a forged update could pose as an admin.
+    telegram_webhook_secret_token: str = ""
 
     # Natural-language control: reply+@mention the bot in the channel (or DM it)
     # to manage Navaar in plain language. Backed by the Claude Agent SDK (in-pod
@@ -36,6 +44,7 @@ class Settings(BaseSettings):
     ytmusic_client_id: str = ""
     ytmusic_client_secret: str = ""
     ytdlp_cookies_file: str = ""
+    ytdlp_max_concurrent: int = 3  # simultaneous yt-dlp processes, and pull retries in flight
 
     spotify_client_id: str = ""
     spotify_client_secret: str = ""
@@ -69,3 +78,12 @@ class Settings(BaseSettings):
     # /readyz reports degraded if a direction hasn't completed a cycle within
     # this multiple of its interval (catches silent crash-loops).
     readiness_stale_multiplier: int = 5
+
+    @model_validator(mode="after")
+    def _require_webhook_secret(self) -> Settings:
+        if self.telegram_webhook_url and not self.telegram_webhook_secret_token:
+            raise ValueError(
+                "NAVAAR_TELEGRAM_WEBHOOK_SECRET_TOKEN is required when "
+                "NAVAAR_TELEGRAM_WEBHOOK_URL is set"
+            )
+        return self
@@ -101,12 +101,34 @@ class SpotifyClient:
         self._sp.playlist_remove_all_occurrences_of_items(self._playlist_id, [track_id])
         logger.info("sp_removed_from_playlist", track_id=track_id)
 
+    @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=2, max=30), retry=retry_if_transient)
+    def get_playlist_id_set(self) -> frozenset[str]:
+        """Track ids in the playlist, for O(1) membership checks across a batch.
+        Pages are fetched with an id-only field mask."""
+        ids: set[str] = set()
+        results = self._sp.playlist_items(self._playlist_id, fields="items(track(id)),next")
+        while results:
+            for item in results.get("items", []):
+                t = item.get("track")
+                if t and t.get("id"):
+                    ids.add(t["id"])
+            if results.get("next"):
+                results = self._sp.next(results)
+            else:
+                break
+        return frozenset(ids)
+
     def is_in_playlist(
-        self, track_id: str, playlist_tracks: list[dict] | None = None
+        self,
+        track_id: str,
+        playlist_tracks: list[dict] | None = None,
+        playlist_ids: frozenset[str] | None = None,
     ) -> bool:
-        if playlist_tracks is None:
-            playlist_tracks = self.get_playlist_tracks()
-        return any(t.get("id") == track_id for t in playlist_tracks)
+        if playlist_ids is None:
+            if playlist_tracks is None:
+                return track_id in self.get_playlist_id_set()
+            return any(t.get("id") == track_id for t in playlist_tracks)
+        return track_id in playlist_ids
 
     def find_best_match(self, artist: str | None, title: str) -> dict | None:
         query = f"{artist} {title}" if artist else title
@@ -18,6 +18,9 @@ from navaar.ytmusic.downloader import YTDownloader
 
 logger = structlog.get_logger()
 
+# New tracks are prefetched (one yt-dlp run) and uploaded this many at a time.
+_PREFETCH_WINDOW = 5
+
 
 class BasePullSync:
     """Shared skeleton for the two pull directions (yt→tg, sp→tg): retry failed
@@ -40,6 +43,7 @@ class BasePullSync:
         sync_log: SyncLogRepository,
         tg_client: TelegramClient,
         downloader: YTDownloader,
+        max_concurrent: int = 3,
     ) -> None:
         self._tracks = track_repo
         self._state = sync_state
@@ -47,6 +51,12 @@ class BasePullSync:
         self._tg = tg_client
         self._dl = downloader
         self._card = None
+        # video_id -> local path of audio fetched ahead by the batch prefetch.
+        self._prefetched: dict[str, str] = {}
+        # Caps how many retries are in flight: each one searches, downloads,
+        # uploads and writes to the DB, and only the yt-dlp step is bounded by
+        # the downloader itself.
+        self._retry_sem = asyncio.Semaphore(max(1, max_concurrent))
 
     # Subclasses set this to the client whose get_playlist_tracks() is diffed.
     _playlist_client: object
@@ -61,17 +71,14 @@ class BasePullSync:
     async def process_new_tracks(self) -> int:
         synced = 0
 
-        # Part 1: retry previously-failed tracks for this direction.
+        # Part 1: retry previously-failed tracks for this direction. Retries are
+        # independent of each other, so run them together, at most
+        # max_concurrent at a time (see _retry_sem).
         retries = await self._tracks.get_pending_tracks(self.direction)
-        for track in retries:
-            if not getattr(track, self.id_field):
-                continue
-            try:
-                await self._retry_track(track)
-                synced += 1
-            except Exception:
-                logger.error(f"{self.direction}_retry_error", track_id=track.id, exc_info=True)
-                SYNC_ERRORS.labels(direction=self.direction, error_type="retry_failed").inc()
+        results = await asyncio.gather(
+            *(self._retry_one(t) for t in retries if getattr(t, self.id_field))
+        )
+        synced += sum(results)
 
         # Part 2: diff the playlist against the stored snapshot.
         playlist_tracks = await asyncio.to_thread(self._playlist_client.get_playlist_tracks)
@@ -84,21 +91,62 @@ class BasePullSync:
         if new_ids:
             logger.info(f"{self.direction}_new_tracks", count=len(new_ids))
             lookup = {t[self.id_key]: t for t in playlist_tracks if t.get(self.id_key)}
-            for new_id in new_ids:
+            # Prefetch a window at a time and upload it before fetching the next,
+            # so a first run (or snapshot reset) over a whole playlist neither
+            # piles every file on disk up front nor holds a downloader slot for
+            # one huge yt-dlp run.
+            for i in range(0, len(new_ids), _PREFETCH_WINDOW):
+                window = new_ids[i:i + _PREFETCH_WINDOW]
+                await self._prefetch(await self._batch_video_ids(window))
                 try:
-                    await self._sync_new(new_id, lookup.get(new_id, {}))
-                    synced += 1
-                except Exception:
-                    logger.error(
-                        f"{self.direction}_track_error",
-                        external_id=new_id,
-                        exc_info=True,
-                    )
-                    SYNC_ERRORS.labels(direction=self.direction, error_type="sync_failed").inc()
+                    for new_id in window:
+                        try:
+                            await self._sync_new(new_id, lookup.get(new_id, {}))
+                            synced += 1
+                        except Exception:
+                            logger.error(
+                                f"{self.direction}_track_error",
+                                external_id=new_id,
+                                exc_info=True,
+                            )
+                            SYNC_ERRORS.labels(
+                                direction=self.direction, error_type="sync_failed"
+                            ).inc()
+                finally:
+                    # Anything prefetched but not consumed (e.g. the track errored
+                    # before its upload) must not leak in the download dir.
+                    for path in self._prefetched.values():
+                        self._dl.cleanup(path)
+                    self._prefetched.clear()
 
         await self._state.set_json(self.snapshot_key, current_ids)
         return synced
 
+    async def _retry_one(self, track) -> bool:
+        try:
+            async with self._retry_sem:
+                await self._retry_track(track)
+            return True
+        except Exception:
+            logger.error(f"{self.direction}_retry_error", track_id=track.id, exc_info=True)
+            SYNC_ERRORS.labels(direction=self.direction, error_type="retry_failed").inc()
+            return False
+
+    async def _batch_video_ids(self, new_ids: list[str]) -> list[str]:
+        """YouTube video ids of new tracks that can be downloaded up front in one
+        batch. Default: none (e.g. Spotify tracks need a YT search first)."""
+        return []
+
+    async def _prefetch(self, video_ids: list[str]) -> None:
+        """Download several videos in one yt-dlp run ahead of the per-track loop.
+        Best-effort: whatever isn't prefetched is downloaded per track as usual."""
+        if len(video_ids) < 2:
+            return
+        try:
+            self._prefetched = await self._dl.download_many(video_ids)
+        except Exception:
+            logger.warning(f"{self.direction}_prefetch_failed", exc_info=True)
+
     async def _download_and_upload(
         self,
         *,
@@ -116,7 +164,9 @@ class BasePullSync:
         try:
             local_path = None
             try:
-                local_path = await self._dl.download(video_id)
+                local_path = self._prefetched.pop(video_id, None)
+                if local_path is None:
+                    local_path = await self._dl.download(video_id)
                 YT_DOWNLOAD_TOTAL.labels(result="success").inc()
             except Exception as e:
                 YT_DOWNLOAD_TOTAL.labels(result="failure").inc()
@@ -62,11 +62,13 @@ class BasePushSync:
         processed = 0
         # Blocking client call off the event loop. A permanent auth failure here
         # propagates to the engine (the systemic-failure path) by design.
-        playlist_tracks = await asyncio.to_thread(self._target.get_playlist_tracks)
+        # Fetched once per cycle (ids only) so each pending track's duplicate
+        # check is an O(1) set lookup instead of a scan of the whole playlist.
+        playlist_ids = await asyncio.to_thread(self._target.get_playlist_id_set)
 
         for track in pending:
             try:
-                await self._process_track(track, playlist_tracks)
+                await self._process_track(track, playlist_ids)
                 processed += 1
             except Exception:
                 logger.error(f"{self.direction}_track_error", track_id=track.id, exc_info=True)
@@ -84,7 +86,7 @@ class BasePushSync:
 
         return processed
 
-    async def _process_track(self, track, playlist_tracks: list[dict]) -> None:
+    async def _process_track(self, track, playlist_ids: frozenset[str]) -> None:
         start = time.monotonic()
         t = self.target
 
@@ -113,7 +115,7 @@ class BasePushSync:
         t.search_total.labels(result="found").inc()
         ext_id = match[t.match_id_key]
 
-        if self._target.is_in_playlist(ext_id, playlist_tracks):
+        if ext_id in playlist_ids:
             await self._tracks.mark_duplicate(track.id)
             await self._tracks.update_track(track.id, **{t.db_field: ext_id})
             await self._log.log(
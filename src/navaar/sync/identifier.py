@@ -66,6 +66,8 @@ def identify_from_tg_metadata(
 
 
 _SEPARATORS = re.compile(r"\s*[-–—]\s*")
+_OFFICIAL = re.compile(r"\(Official.*?\)", re.IGNORECASE)
+_BRACKETED = re.compile(r"\[.*?\]")
 
 
 def identify_from_filename(file_name: str | None) -> TrackInfo | None:
@@ -73,8 +75,8 @@ def identify_from_filename(file_name: str | None) -> TrackInfo | None:
         return None
     stem = Path(file_name).stem
     # Clean up common patterns
-    stem = re.sub(r"\(Official.*?\)", "", stem, flags=re.IGNORECASE).strip()
-    stem = re.sub(r"\[.*?\]", "", stem).strip()
+    stem = _OFFICIAL.sub("", stem).strip()
+    stem = _BRACKETED.sub("", stem).strip()
 
     parts = _SEPARATORS.split(stem, maxsplit=1)
     if len(parts) == 2:
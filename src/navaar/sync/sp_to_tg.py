@@ -34,8 +34,11 @@ class SpToTgSync(BasePullSync):
         sp_client: SpotifyClient,
         yt_client: YTMusicClient,
         downloader: YTDownloader,
+        max_concurrent: int = 3,
     ) -> None:
-        super().__init__(track_repo, sync_state, sync_log, tg_client, downloader)
+        super().__init__(
+            track_repo, sync_state, sync_log, tg_client, downloader, max_concurrent
+        )
         self._sp = sp_client
         self._yt = yt_client
         self._playlist_client = sp_client
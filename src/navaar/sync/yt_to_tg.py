@@ -32,8 +32,11 @@ class YtToTgSync(BasePullSync):
         yt_client: YTMusicClient,
         downloader: YTDownloader,
         sp_enabled: bool = False,
+        max_concurrent: int = 3,
     ) -> None:
-        super().__init__(track_repo, sync_state, sync_log, tg_client, downloader)
+        super().__init__(
+            track_repo, sync_state, sync_log, tg_client, downloader, max_concurrent
+        )
         self._yt = yt_client
         self._playlist_client = yt_client
         self._fanout = FanOut(track_repo, sp_enabled=sp_enabled)
@@ -51,11 +54,19 @@ class YtToTgSync(BasePullSync):
             start=start,
         )
 
+    async def _already_synced(self, video_id: str) -> bool:
+        existing = await self._tracks.get_track_by_yt_video_id(video_id)
+        return bool(existing and existing.status in ("synced", "duplicate"))
+
+    async def _batch_video_ids(self, new_ids: list[str]) -> list[str]:
+        # New playlist entries are YouTube videos already: batch-download the ones
+        # that _sync_new won't skip.
+        return [v for v in new_ids if not await self._already_synced(v)]
+
     async def _sync_new(self, video_id: str, meta: dict) -> None:
         start = time.monotonic()
 
-        existing = await self._tracks.get_track_by_yt_video_id(video_id)
-        if existing and existing.status in ("synced", "duplicate"):
+        if await self._already_synced(video_id):
             logger.debug("yt_to_tg_already_synced", video_id=video_id)
             return
 
@@ -5,6 +5,7 @@ import contextlib
 import html
 import re
 import time
+from collections.abc import Iterator
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
@@ -59,6 +60,20 @@ _DIR = {
     "sp_to_yt": "\U0001f3b5 SP \u2192 YT",
 }
 
+# Telegram rejects messages over 4096 chars; split long lists below that, leaving
+# headroom for entity overhead.
+_MESSAGE_CAP = 3800
+
+# /search results are cached briefly so repeating a query doesn't re-hit the API.
+_SEARCH_CACHE_TTL = 300.0
+_SEARCH_CACHE_MAX = 256
+
+# /stats success-rate bar: every possible fill level, built once.
+_BAR_LEN = 12
+_BARS = [
+    "\u2588" * filled + "\u2591" * (_BAR_LEN - filled) for filled in range(_BAR_LEN + 1)
+]
+
 
 def _track_line(t, verbose: bool = False) -> str:
     icon = _S.get(t.status, "\u2753")
@@ -76,14 +91,17 @@ def _track_line(t, verbose: bool = False) -> str:
     return line
 
 
-def _ago(dt: datetime | None) -> str:
-    if not dt:
-        return "never"
-    now = datetime.now(UTC)
+def _epoch(dt: datetime) -> float:
+    # SQLite hands back naive datetimes that are UTC by convention.
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=UTC)
-    delta = now - dt
-    secs = int(delta.total_seconds())
+    return dt.timestamp()
+
+
+def _ago_from_ts(now_ts: float, then_ts: float) -> str:
+    """Relative age between two epoch timestamps. Loops rendering many rows take
+    ``now_ts`` once instead of re-reading the clock per row."""
+    secs = int(now_ts - then_ts)
     if secs < 60:
         return f"{secs}s ago"
     if secs < 3600:
@@ -93,6 +111,99 @@ def _ago(dt: datetime | None) -> str:
     return f"{secs // 86400}d ago"
 
 
+def _ago(dt: datetime | None) -> str:
+    if not dt:
+        return "never"
+    return _ago_from_ts(time.time(), _epoch(dt))
+
+
+def _chunk_html(lines: list[str], cap: int = _MESSAGE_CAP) -> Iterator[str]:
+    """Join ``lines`` into messages of at most ``cap`` chars. Splits only between
+    lines — each line is self-contained HTML, so no tag is ever cut in half."""
+    chunk: list[str] = []
+    size = 0
+    for line in lines:
+        extra = len(line) + 1 if chunk else len(line)
+        if chunk and size + extra > cap:
+            yield "\n".join(chunk)
+            chunk, size, extra = [], 0, len(line)
+        chunk.append(line)
+        size += extra
+    if chunk:
+        yield "\n".join(chunk)
+
+
+def _log_line(entry, now_ts: float) -> str:
+    tid = f"#{entry.track_id}" if entry.track_id else "-"
+    direction = _DIR.get(entry.direction, "") if entry.direction else ""
+    ago = _ago_from_ts(now_ts, _epoch(entry.created_at))
+    return f"<code>{tid:>5}</code> {entry.event} {direction} <i>{ago}</i>"
+
+
+def _help_text(sp_enabled: bool) -> str:
+    sp_cmds = ""
+    if sp_enabled:
+        sp_cmds = (
+            "/sync sp \u2014 Force SP\u2192TG + SP\u2192YT sync\n"
+            "/retry sp \u2014 Retry all failed SP tracks\n"
+            "/search_sp &lt;query&gt; \u2014 Search Spotify\n"
+        )
+    return (
+        "<b>\U0001f3b5 Navaar \u2014 Bot Commands</b>\n"
+        "\n"
+        "<b>Monitoring</b>\n"
+        "/status \u2014 Live sync status dashboard\n"
+        "/stats \u2014 Aggregate statistics\n"
+        "/queue \u2014 Pending tracks waiting to sync\n"
+        "/recent [n] \u2014 Last n synced tracks (default 10)\n"
+        "/track &lt;id&gt; \u2014 Full details for a track\n"
+        "/card [id] \u2014 Post/refresh a track's status card\n"
+        "/logs [n] \u2014 Recent sync log entries\n"
+        "\n"
+        "<b>Actions</b>\n"
+        "/sync \u2014 Force immediate sync (all directions)\n"
+        "/sync tg \u2014 Force TG\u2192YT sync only\n"
+        "/sync yt \u2014 Force YT\u2192TG sync only\n"
+        f"{sp_cmds}"
+        "/retry &lt;id&gt; \u2014 Retry a single failed track\n"
+        "/retry all \u2014 Retry all failed tracks\n"
+        "/retry tg \u2014 Retry all failed TG\u2192YT\n"
+        "/retry yt \u2014 Retry all failed YT\u2192TG\n"
+        "/delete &lt;id&gt; \u2014 Remove a track from DB\n"
+        "\n"
+        "<b>Assistant</b>\n"
+        "/context \u2014 Conversation context usage\n"
+        "/compact \u2014 Summarize + shrink the conversation\n"
+        "/reset \u2014 Wipe the conversation memory\n"
+        "\n"
+        "<b>Debugging</b>\n"
+        "/search &lt;query&gt; \u2014 Search YouTube Music\n"
+        "/failed [tg|yt|sp] \u2014 List failed tracks\n"
+        "/config \u2014 Show current configuration\n"
+        "/ping \u2014 Check bot responsiveness\n"
+        "/help \u2014 This message"
+    )
+
+
+def _status_keyboard(sp_enabled: bool) -> InlineKeyboardMarkup:
+    buttons_row1 = [
+        InlineKeyboardButton("\U0001f504 Sync TG\u2192YT", callback_data="sync_tg_to_yt"),
+        InlineKeyboardButton("\U0001f504 Sync YT\u2192TG", callback_data="sync_yt_to_tg"),
+    ]
+    buttons_row2 = [
+        InlineKeyboardButton("\U0001f4cb Failed", callback_data="show_failed"),
+        InlineKeyboardButton("\U0001f4ca Stats", callback_data="show_stats"),
+    ]
+    rows = [buttons_row1]
+    if sp_enabled:
+        rows.append([
+            InlineKeyboardButton("\U0001f504 Sync SP\u2192TG", callback_data="sync_sp_to_tg"),
+            InlineKeyboardButton("\U0001f504 Sync SP\u2192YT", callback_data="sync_sp_to_yt"),
+        ])
+    rows.append(buttons_row2)
+    return InlineKeyboardMarkup(rows)
+
+
 class NavaarBot:
     def __init__(
         self,
@@ -122,6 +233,29 @@ class NavaarBot:
         self._bot_username: str | None = None
         self._app: Application | None = None
         self._start_time = time.time()
+        self._search_cache: dict[tuple[str, str, int], tuple[float, list[dict]]] = {}
+        # Static replies, rendered once: they depend only on whether Spotify is on.
+        self._help_text = _help_text(self._sp_enabled)
+        # Markups are immutable, so one instance is shared by every reply.
+        self._status_kb = _status_keyboard(self._sp_enabled)
+        self._failed_kb = InlineKeyboardMarkup([
+            [InlineKeyboardButton("\U0001f504 Retry All", callback_data="retry_all")],
+        ])
+        # Inline-button dispatch: exact callback_data first, then the id-carrying
+        # prefixes ("retry_all" is exact, so it never reaches the retry_ prefix).
+        self._cb_exact = {
+            "sync_tg_to_yt": self._cb_sync,
+            "sync_yt_to_tg": self._cb_sync,
+            "sync_sp_to_tg": self._cb_sync,
+            "sync_sp_to_yt": self._cb_sync,
+            "show_failed": self._cb_show_failed,
+            "show_stats": self._cb_show_stats,
+            "retry_all": self._cb_retry_all,
+        }
+        self._cb_prefix = (
+            ("retry_", self._cb_retry_id),
+            ("delete_", self._cb_delete_id),
+        )
 
     def set_sync_engine(self, engine: SyncEngine) -> None:
         self._engine = engine
@@ -356,49 +490,7 @@ class NavaarBot:
     async def _cmd_help(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         if not self._is_admin(update):
             return
-        sp_cmds = ""
-        if self._sp_enabled:
-            sp_cmds = (
-                "/sync sp \u2014 Force SP\u2192TG + SP\u2192YT sync\n"
-                "/retry sp \u2014 Retry all failed SP tracks\n"
-                "/search_sp &lt;query&gt; \u2014 Search Spotify\n"
-            )
-        text = (
-            "<b>\U0001f3b5 Navaar \u2014 Bot Commands</b>\n"
-            "\n"
-            "<b>Monitoring</b>\n"
-            "/status \u2014 Live sync status dashboard\n"
-            "/stats \u2014 Aggregate statistics\n"
-            "/queue \u2014 Pending tracks waiting to sync\n"
-            "/recent [n] \u2014 Last n synced tracks (default 10)\n"
-            "/track &lt;id&gt; \u2014 Full details for a track\n"
-            "/card [id] \u2014 Post/refresh a track's status card\n"
-            "/logs [n] \u2014 Recent sync log entries\n"
-            "\n"
-            "<b>Actions</b>\n"
-            "/sync \u2014 Force immediate sync (all directions)\n"
-            "/sync tg \u2014 Force TG\u2192YT sync only\n"
-            "/sync yt \u2014 Force YT\u2192TG sync only\n"
-            f"{sp_cmds}"
-            "/retry &lt;id&gt; \u2014 Retry a single failed track\n"
-            "/retry all \u2014 Retry all failed tracks\n"
-            "/retry tg \u2014 Retry all failed TG\u2192YT\n"
-            "/retry yt \u2014 Retry all failed YT\u2192TG\n"
-            "/delete &lt;id&gt; \u2014 Remove a track from DB\n"
-            "\n"
-            "<b>Assistant</b>\n"
-            "/context \u2014 Conversation context usage\n"
-            "/compact \u2014 Summarize + shrink the conversation\n"
-            "/reset \u2014 Wipe the conversation memory\n"
-            "\n"
-            "<b>Debugging</b>\n"
-            "/search &lt;query&gt; \u2014 Search YouTube Music\n"
-            "/failed [tg|yt|sp] \u2014 List failed tracks\n"
-            "/config \u2014 Show current configuration\n"
-            "/ping \u2014 Check bot responsiveness\n"
-            "/help \u2014 This message"
-        )
-        await self._reply(update, text)
+        await self._reply(update, self._help_text)
 
     # ── /ping ────────────────────────────────────────────────────────
 
@@ -460,6 +552,7 @@ class NavaarBot:
             "",
         ]
 
+        now_ts = time.time()
         # Determine which directions to show
         active_dirs = {"tg_to_yt": True, "yt_to_tg": True}
         if self._sp_enabled:
@@ -477,7 +570,7 @@ class NavaarBot:
             dupes = dc.get("duplicate", 0)
 
             last_ts = await self._state.get(f"last_{direction}_sync") if self._state else None
-            last_str = _ago(datetime.fromtimestamp(float(last_ts), tz=UTC)) if last_ts else "never"
+            last_str = _ago_from_ts(now_ts, float(last_ts)) if last_ts else "never"
 
             lines.append(f"<b>{label}</b>  (last sync: {last_str})")
             parts = []
@@ -492,23 +585,7 @@ class NavaarBot:
             lines.append("  " + "  |  ".join(parts) if parts else "  No tracks")
             lines.append("")
 
-        buttons_row1 = [
-            InlineKeyboardButton("\U0001f504 Sync TG\u2192YT", callback_data="sync_tg_to_yt"),
-            InlineKeyboardButton("\U0001f504 Sync YT\u2192TG", callback_data="sync_yt_to_tg"),
-        ]
-        buttons_row2 = [
-            InlineKeyboardButton("\U0001f4cb Failed", callback_data="show_failed"),
-            InlineKeyboardButton("\U0001f4ca Stats", callback_data="show_stats"),
-        ]
-        rows = [buttons_row1]
-        if self._sp_enabled:
-            rows.append([
-                InlineKeyboardButton("\U0001f504 Sync SP\u2192TG", callback_data="sync_sp_to_tg"),
-                InlineKeyboardButton("\U0001f504 Sync SP\u2192YT", callback_data="sync_sp_to_yt"),
-            ])
-        rows.append(buttons_row2)
-        keyboard = InlineKeyboardMarkup(rows)
-        await self._reply(update, "\n".join(lines), reply_markup=keyboard)
+        await self._reply(update, "\n".join(lines), reply_markup=self._status_kb)
 
     # ── /stats ───────────────────────────────────────────────────────
 
@@ -516,10 +593,9 @@ class NavaarBot:
         if not self._is_admin(update):
             return
         stats = await self._tracks.get_stats()
-        bar_len = 12
         synced_pct = stats["success_rate"]
-        filled = round(bar_len * synced_pct / 100) if stats["total"] else 0
-        bar = "\u2588" * filled + "\u2591" * (bar_len - filled)
+        filled = round(_BAR_LEN * synced_pct / 100) if stats["total"] else 0
+        bar = _BARS[max(0, min(_BAR_LEN, filled))]
 
         synced_detail = (
             f"{stats['tg_to_yt_synced']} TG\u2192YT, {stats['yt_to_tg_synced']} YT\u2192TG"
@@ -560,11 +636,11 @@ class NavaarBot:
             return
 
         lines = [f"<b>\u23f3 Queue ({len(all_pending)} tracks)</b>\n"]
-        for t in all_pending[:20]:
-            lines.append(_track_line(t, verbose=True))
+        lines.extend([_track_line(t, verbose=True) for t in all_pending[:20]])
         if len(all_pending) > 20:
             lines.append(f"\n<i>... and {len(all_pending) - 20} more</i>")
-        await self._reply(update, "\n".join(lines))
+        for chunk in _chunk_html(lines):
+            await self._reply(update, chunk)
 
     # ── /recent [n] ─────────────────────────────────────────────────
 
@@ -583,11 +659,14 @@ class NavaarBot:
             await self._reply(update, "No tracks yet.")
             return
 
-        lines = [f"<b>\U0001f55b Recent Tracks (last {len(tracks)})</b>\n"]
-        for t in tracks:
-            synced_str = _ago(t.synced_at) if t.synced_at else ""
-            lines.append(f"{_track_line(t)}  <i>{synced_str}</i>")
-        await self._reply(update, "\n".join(lines))
+        now_ts = time.time()
+        header = f"<b>\U0001f55b Recent Tracks (last {len(tracks)})</b>\n"
+        body = "\n".join([
+            f"{_track_line(t)}  <i>"
+            f"{_ago_from_ts(now_ts, _epoch(t.synced_at)) if t.synced_at else ''}</i>"
+            for t in tracks
+        ])
+        await self._reply(update, f"{header}\n{body}")
 
     # ── /track <id> ──────────────────────────────────────────────────
 
@@ -647,8 +726,11 @@ class NavaarBot:
         logs = await self._log.get_logs_for_track(t.id, limit=5)
         if logs:
             lines.append("\n<b>Log:</b>")
-            for entry in reversed(logs):
-                lines.append(f"  \u2022 {entry.event} ({_ago(entry.created_at)})")
+            now_ts = time.time()
+            lines.extend([
+                f"  \u2022 {entry.event} ({_ago_from_ts(now_ts, _epoch(entry.created_at))})"
+                for entry in reversed(logs)
+            ])
 
         buttons = []
         if t.status == "failed":
@@ -708,12 +790,11 @@ class NavaarBot:
             await self._reply(update, "No log entries yet.")
             return
 
+        now_ts = time.time()
         lines = [f"<b>\U0001f4dc Recent Logs (last {len(logs)})</b>\n"]
-        for entry in logs:
-            tid = f"#{entry.track_id}" if entry.track_id else "-"
-            direction = _DIR.get(entry.direction, "") if entry.direction else ""
-            lines.append(f"<code>{tid:>5}</code> {entry.event} {direction} <i>{_ago(entry.created_at)}</i>")
-        await self._reply(update, "\n".join(lines))
+        lines.extend([_log_line(entry, now_ts) for entry in logs])
+        for chunk in _chunk_html(lines):
+            await self._reply(update, chunk)
 
     # ── /failed [tg|yt|sp] ──────────────────────────────────────────
 
@@ -746,15 +827,15 @@ class NavaarBot:
             return
 
         lines = [f"<b>\u274c Failed Tracks ({len(failed)})</b>\n"]
-        for t in failed[:20]:
-            lines.append(_track_line(t, verbose=True))
+        lines.extend([_track_line(t, verbose=True) for t in failed[:20]])
         if len(failed) > 20:
             lines.append(f"\n<i>... and {len(failed) - 20} more</i>")
 
-        keyboard = InlineKeyboardMarkup([
-            [InlineKeyboardButton("\U0001f504 Retry All", callback_data="retry_all")],
-        ])
-        await self._reply(update, "\n".join(lines), reply_markup=keyboard)
+        # The Retry All button goes on the last message only.
+        chunks = list(_chunk_html(lines))
+        for chunk in chunks[:-1]:
+            await self._reply(update, chunk)
+        await self._reply(update, chunks[-1], reply_markup=self._failed_kb)
 
     # ── /sync [tg|yt|sp|all] ────────────────────────────────────────
 
@@ -876,7 +957,7 @@ class NavaarBot:
         await self._reply(update, f"\U0001f50d Searching: <i>{html.escape(query)}</i>...")
 
         try:
-            results = self._yt.search_song(query, limit=5)
+            results = await self._cached_search("yt", self._yt.search_song, query)
         except Exception as e:
             await self._reply(update, f"\u274c Search failed: {html.escape(str(e)[:100])}")
             return
@@ -895,6 +976,22 @@ class NavaarBot:
             )
         await self._reply(update, "\n".join(lines))
 
+    async def _cached_search(self, service: str, search, query: str, limit: int = 5) -> list[dict]:
+        """Run a blocking client search off the event loop, memoized per
+        (service, query, limit) for _SEARCH_CACHE_TTL seconds. Failures aren't cached."""
+        key = (service, query, limit)
+        now = time.monotonic()
+        hit = self._search_cache.get(key)
+        if hit and now - hit[0] < _SEARCH_CACHE_TTL:
+            return hit[1]
+        results = await asyncio.to_thread(search, query, limit=limit)
+        self._search_cache.pop(key, None)
+        if len(self._search_cache) >= _SEARCH_CACHE_MAX:
+            # Dicts keep insertion order, so the first key is the oldest entry.
+            self._search_cache.pop(next(iter(self._search_cache)))
+        self._search_cache[key] = (now, results)
+        return results
+
     # ── /search_sp <query> ───────────────────────────────────────────
 
     async def _cmd_search_sp(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -911,7 +1008,7 @@ class NavaarBot:
         await self._reply(update, f"\U0001f50d Searching Spotify: <i>{html.escape(query)}</i>...")
 
         try:
-            results = self._sp.search_track(query, limit=5)
+            results = await self._cached_search("sp", self._sp.search_track, query)
         except Exception as e:
             await self._reply(update, f"\u274c Search failed: {html.escape(str(e)[:100])}")
             return
@@ -941,50 +1038,73 @@ class NavaarBot:
         data = query.data
         await query.answer()
 
-        if data.startswith("sync_") and not data.startswith("sync_tg") and not data.startswith("sync_yt") and not data.startswith("sync_sp"):
-            pass  # fall through
-        elif data in ("sync_tg_to_yt", "sync_yt_to_tg", "sync_sp_to_tg", "sync_sp_to_yt"):
-            if self._engine:
-                self._engine.force_sync(data.removeprefix("sync_"))
-                label = _DIR.get(data.removeprefix("sync_"), data)
-                await query.message.reply_text(
-                    f"\U0001f504 {label} sync triggered!", parse_mode="HTML"
-                )
-        elif data == "show_failed":
-            await self._cmd_failed(update, context)
-        elif data == "show_stats":
-            await self._cmd_stats(update, context)
-        elif data == "retry_all":
-            count = await self._tracks.reset_all_failed()
-            for d in _DIR:
-                RETRIES_TOTAL.labels(direction=d).inc(count)
-            await query.message.reply_text(
-                f"\U0001f504 Reset {count} failed tracks for retry.", parse_mode="HTML"
+        handler = self._cb_exact.get(data)
+        if handler is not None:
+            await handler(update, context, data)
+            return
+        for prefix, handler in self._cb_prefix:
+            if data.startswith(prefix):
+                await handler(update, context, data.removeprefix(prefix))
+                return
+
+    async def _cb_sync(self, update: Update, context: ContextTypes.DEFAULT_TYPE, data: str) -> None:
+        if self._engine:
+            direction = data.removeprefix("sync_")
+            self._engine.force_sync(direction)
+            label = _DIR.get(direction, data)
+            await update.callback_query.message.reply_text(
+                f"\U0001f504 {label} sync triggered!", parse_mode="HTML"
+            )
+
+    async def _cb_show_failed(
+        self, update: Update, context: ContextTypes.DEFAULT_TYPE, data: str
+    ) -> None:
+        await self._cmd_failed(update, context)
+
+    async def _cb_show_stats(
+        self, update: Update, context: ContextTypes.DEFAULT_TYPE, data: str
+    ) -> None:
+        await self._cmd_stats(update, context)
+
+    async def _cb_retry_all(
+        self, update: Update, context: ContextTypes.DEFAULT_TYPE, data: str
+    ) -> None:
+        count = await self._tracks.reset_all_failed()
+        for d in _DIR:
+            RETRIES_TOTAL.labels(direction=d).inc(count)
+        await update.callback_query.message.reply_text(
+            f"\U0001f504 Reset {count} failed tracks for retry.", parse_mode="HTML"
+        )
+
+    async def _cb_retry_id(
+        self, update: Update, context: ContextTypes.DEFAULT_TYPE, arg: str
+    ) -> None:
+        track_id = int(arg)
+        track = await self._tracks.get_track(track_id)
+        if track and track.status == "failed":
+            await self._tracks.reset_for_retry(track_id)
+            RETRIES_TOTAL.labels(direction=track.direction).inc()
+            await update.callback_query.message.reply_text(
+                f"\U0001f504 Track #{track_id} queued for retry.", parse_mode="HTML"
+            )
+        else:
+            await update.callback_query.message.reply_text(
+                f"\u274c Track #{track_id} is not in failed state.", parse_mode="HTML"
+            )
+
+    async def _cb_delete_id(
+        self, update: Update, context: ContextTypes.DEFAULT_TYPE, arg: str
+    ) -> None:
+        track_id = int(arg)
+        deleted = await self._tracks.delete_track(track_id)
+        if deleted:
+            await update.callback_query.message.reply_text(
+                f"\U0001f5d1 Track #{track_id} deleted.", parse_mode="HTML"
+            )
+        else:
+            await update.callback_query.message.reply_text(
+                f"\u274c Track #{track_id} not found.", parse_mode="HTML"
             )
-        elif data.startswith("retry_"):
-            track_id = int(data.split("_")[1])
-            track = await self._tracks.get_track(track_id)
-            if track and track.status == "failed":
-                await self._tracks.reset_for_retry(track_id)
-                RETRIES_TOTAL.labels(direction=track.direction).inc()
-                await query.message.reply_text(
-                    f"\U0001f504 Track #{track_id} queued for retry.", parse_mode="HTML"
-                )
-            else:
-                await query.message.reply_text(
-                    f"\u274c Track #{track_id} is not in failed state.", parse_mode="HTML"
-                )
-        elif data.startswith("delete_"):
-            track_id = int(data.split("_")[1])
-            deleted = await self._tracks.delete_track(track_id)
-            if deleted:
-                await query.message.reply_text(
-                    f"\U0001f5d1 Track #{track_id} deleted.", parse_mode="HTML"
-                )
-            else:
-                await query.message.reply_text(
-                    f"\u274c Track #{track_id} not found.", parse_mode="HTML"
-                )
 
     # ── Slash-command menu ───────────────────────────────────────────
 
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import os
 import tempfile
 from pathlib import Path
 
+import httpx
 import structlog
 from telegram import Bot
 from tenacity import retry, stop_after_attempt, wait_exponential
@@ -16,6 +18,10 @@ class TelegramClient:
     def __init__(self, bot: Bot, channel_id: int) -> None:
         self._bot = bot
         self._channel_id = channel_id
+        self._http = httpx.AsyncClient(timeout=httpx.Timeout(120.0, connect=30.0))
+
+    async def close(self) -> None:
+        await self._http.aclose()
 
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=2, max=30))
     async def download_file(self, file_id: str, dest_dir: str | None = None) -> str:
@@ -26,7 +32,11 @@ class TelegramClient:
             tg_file = await self._bot.get_file(file_id)
             file_name = tg_file.file_path.split("/")[-1] if tg_file.file_path else f"{file_id}.mp3"
             local_path = str(Path(dest_dir) / file_name)
-            await tg_file.download_to_drive(local_path)
+            if tg_file.file_path and tg_file.file_path.startswith(("https://", "http://")):
+                await self._stream_to_disk(tg_file.file_path, local_path)
+            else:
+                # Local-mode Bot API server: file_path is already on disk.
+                await tg_file.download_to_drive(local_path)
             TG_DOWNLOAD_TOTAL.labels(result="success").inc()
         except Exception:
             TG_DOWNLOAD_TOTAL.labels(result="failure").inc()
@@ -35,6 +45,21 @@ class TelegramClient:
         logger.info("tg_file_downloaded", file_id=file_id, path=local_path)
         return local_path
 
+    async def _stream_to_disk(self, url: str, local_path: str) -> None:
+        """Stream ``url`` into ``local_path``. PTB's download_to_drive reads the
+        whole file into memory before writing it, which spikes RSS on long audio."""
+        async with self._http.stream("GET", url) as resp:
+            if resp.is_error:
+                # The file URL embeds the bot token — keep it out of the exception
+                # (and therefore out of logged tracebacks).
+                raise RuntimeError(f"telegram file download failed: HTTP {resp.status_code}")
+            with open(local_path, "wb") as f:
+                # No chunk_size: httpx would re-buffer every network read through a
+                # BytesIO and slice it (three copies per chunk). Writing the reads as
+                # they arrive keeps one allocation per chunk and memory still flat.
+                async for chunk in resp.aiter_bytes():
+                    f.write(chunk)
+
     async def send_audio(
         self,
         file_path: str,
@@ -67,6 +92,8 @@ class TelegramClient:
 
     def cleanup(self, file_path: str) -> None:
         try:
-            Path(file_path).unlink(missing_ok=True)
+            os.unlink(file_path)
+        except FileNotFoundError:
+            pass
         except OSError:
             logger.debug("cleanup_failed", path=file_path, exc_info=True)
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import json
+import threading
 import time
+from collections.abc import Iterator
 
 import httpx
 import structlog
@@ -14,6 +16,17 @@ logger = structlog.get_logger()
 
 YT_API_BASE = "https://www.googleapis.com/youtube/v3"
 
+# Partial-response masks: ask the Data API for only the fields we read. Playlist
+# pages are chained by opaque nextPageToken values, so they can't be fetched in
+# parallel — trimming each page (descriptions, thumbnails, etags…) is what
+# shortens a multi-page fetch instead.
+_SEARCH_FIELDS = "items(id/videoId,snippet(title,channelTitle))"
+_PLAYLIST_FIELDS = (
+    "nextPageToken,items(id,snippet(title,videoOwnerChannelTitle,resourceId/videoId))"
+)
+# The push syncs' per-cycle duplicate check (get_playlist_id_set) only needs ids.
+_PLAYLIST_ID_FIELDS = "nextPageToken,items(snippet/resourceId/videoId)"
+
 
 class YTMusicClient:
     """YouTube Music client using the official YouTube Data API v3 with OAuth."""
@@ -29,8 +42,29 @@ class YTMusicClient:
         self._playlist_id = playlist_id
         self._client_id = client_id
         self._client_secret = client_secret
+        # One pooled client for every Data API call: keep-alive connections avoid a
+        # fresh TCP+TLS handshake per request (matters when paging a big playlist).
+        # The bearer header is set on the client and swapped in place on refresh.
+        # Failed connects (dropped keep-alive, DNS/TLS blips) are retried by the
+        # transport right away instead of costing a tenacity attempt and backoff;
+        # tenacity on the methods still covers 5xx/429 and read timeouts.
+        self._http = httpx.Client(
+            base_url=YT_API_BASE,
+            timeout=30.0,
+            transport=httpx.HTTPTransport(retries=2),
+        )
         self._token = self._load_token()
+        # Expiry cached as a float so the per-request freshness check is a single
+        # comparison; the token file is only rewritten after an actual refresh.
+        self._expires_at = float(self._token.get("expires_at", 0))
+        # Several sync directions call this client concurrently from worker threads
+        # (asyncio.to_thread); the lock makes them share one refresh per expiry.
+        self._refresh_lock = threading.Lock()
         self._ensure_fresh_token()
+        self._http.headers["Authorization"] = f"Bearer {self._token['access_token']}"
+
+    def close(self) -> None:
+        self._http.close()
 
     def _load_token(self) -> dict:
         with open(self._auth_file) as f:
@@ -41,10 +75,16 @@ class YTMusicClient:
             json.dump(self._token, f, indent=1)
 
     def _ensure_fresh_token(self) -> None:
-        if self._token.get("expires_at", 0) < time.time() + 60:
-            self._refresh_token()
+        if self._expires_at >= time.time() + 60:
+            return
+        with self._refresh_lock:
+            # Re-check: another thread may have refreshed while we waited.
+            if self._expires_at < time.time() + 60:
+                self._refresh_token()
 
     def _refresh_token(self) -> None:
+        # Deliberately not self._http: the token endpoint is a different host and
+        # must never receive the API bearer header.
         resp = httpx.post(
             "https://oauth2.googleapis.com/token",
             data={
@@ -71,28 +111,32 @@ class YTMusicClient:
         data = resp.json()
         self._token["access_token"] = data["access_token"]
         self._token["expires_at"] = int(time.time()) + data["expires_in"]
+        self._expires_at = float(self._token["expires_at"])
         self._token["expires_in"] = data["expires_in"]
         self._save_token()
+        self._http.headers["Authorization"] = f"Bearer {data['access_token']}"
         logger.debug("oauth_token_refreshed")
 
     def get_access_token(self) -> str:
         self._ensure_fresh_token()
         return self._token["access_token"]
 
-    def _headers(self) -> dict[str, str]:
-        return {"Authorization": f"Bearer {self.get_access_token()}"}
+    def _api(self) -> httpx.Client:
+        """The pooled API client, with the bearer token refreshed if near expiry."""
+        self._ensure_fresh_token()
+        return self._http
 
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=2, max=30), retry=retry_if_transient)
     def search_song(self, query: str, limit: int = 5) -> list[dict]:
-        resp = httpx.get(
-            f"{YT_API_BASE}/search",
-            headers=self._headers(),
+        resp = self._api().get(
+            "/search",
             params={
                 "part": "snippet",
                 "q": query,
                 "type": "video",
                 "videoCategoryId": "10",  # Music
                 "maxResults": limit,
+                "fields": _SEARCH_FIELDS,
             },
         )
         resp.raise_for_status()
@@ -108,49 +152,47 @@ class YTMusicClient:
         logger.debug("yt_search", query=query, result_count=len(results))
         return results
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=2, max=30), retry=retry_if_transient)
-    def get_playlist_tracks(self) -> list[dict]:
-        tracks: list[dict] = []
+    def _iter_playlist_items(self, fields: str) -> Iterator[dict]:
+        """Raw playlistItems across all pages, trimmed to the ``fields`` mask."""
         page_token = None
-
         while True:
             params: dict[str, str | int] = {
                 "part": "snippet",
                 "playlistId": self._playlist_id,
                 "maxResults": 50,
+                "fields": fields,
             }
             if page_token:
                 params["pageToken"] = page_token
 
-            resp = httpx.get(
-                f"{YT_API_BASE}/playlistItems",
-                headers=self._headers(),
-                params=params,
-            )
+            resp = self._api().get("/playlistItems", params=params)
             resp.raise_for_status()
             data = resp.json()
-
-            for item in data.get("items", []):
-                snippet = item["snippet"]
-                tracks.append({
-                    "videoId": snippet["resourceId"]["videoId"],
-                    "title": snippet["title"],
-                    "artists": [{"name": snippet.get("videoOwnerChannelTitle", "")}],
-                    "setVideoId": item["id"],  # playlistItem ID, needed for removal
-                })
+            yield from data.get("items", [])
 
             page_token = data.get("nextPageToken")
             if not page_token:
-                break
+                return
+
+    @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=2, max=30), retry=retry_if_transient)
+    def get_playlist_tracks(self) -> list[dict]:
+        tracks: list[dict] = []
+        for item in self._iter_playlist_items(_PLAYLIST_FIELDS):
+            snippet = item["snippet"]
+            tracks.append({
+                "videoId": snippet["resourceId"]["videoId"],
+                "title": snippet["title"],
+                "artists": [{"name": snippet.get("videoOwnerChannelTitle", "")}],
+                "setVideoId": item["id"],  # playlistItem ID, needed for removal
+            })
 
         logger.debug("yt_playlist_fetched", track_count=len(tracks))
         return tracks
 
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=2, max=30), retry=retry_if_transient)
     def add_to_playlist(self, video_id: str) -> dict:
-        resp = httpx.post(
-            f"{YT_API_BASE}/playlistItems",
-            headers={**self._headers(), "Content-Type": "application/json"},
+        resp = self._api().post(
+            "/playlistItems",
             params={"part": "snippet"},
             json={
                 "snippet": {
@@ -181,19 +223,34 @@ class YTMusicClient:
         if not set_video_id:
             logger.info("yt_remove_not_in_playlist", video_id=video_id)
             return False
-        resp = httpx.delete(
-            f"{YT_API_BASE}/playlistItems",
-            headers=self._headers(),
-            params={"id": set_video_id},
-        )
+        resp = self._api().delete("/playlistItems", params={"id": set_video_id})
         resp.raise_for_status()
         logger.info("yt_removed_from_playlist", video_id=video_id, set_video_id=set_video_id)
         return True
 
-    def is_in_playlist(self, video_id: str, playlist_tracks: list[dict] | None = None) -> bool:
-        if playlist_tracks is None:
-            playlist_tracks = self.get_playlist_tracks()
-        return any(t.get("videoId") == video_id for t in playlist_tracks)
+    @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=2, max=30), retry=retry_if_transient)
+    def get_playlist_id_set(self) -> frozenset[str]:
+        """Video ids in the playlist, for O(1) membership checks across a batch.
+        Reads the ids straight off the id-only pages: no per-track dicts."""
+        return frozenset(
+            vid
+            for item in self._iter_playlist_items(_PLAYLIST_ID_FIELDS)
+            if (vid := item["snippet"]["resourceId"].get("videoId"))
+        )
+
+    def is_in_playlist(
+        self,
+        video_id: str,
+        playlist_tracks: list[dict] | None = None,
+        playlist_ids: frozenset[str] | None = None,
+    ) -> bool:
+        """Membership test. Pass ``playlist_ids`` (built once per sync cycle) when
+        checking many ids; ``playlist_tracks`` is still accepted for one-offs."""
+        if playlist_ids is None:
+            if playlist_tracks is None:
+                return video_id in self.get_playlist_id_set()
+            return any(t.get("videoId") == video_id for t in playlist_tracks)
+        return video_id in playlist_ids
 
     def find_best_match(self, artist: str | None, title: str) -> dict | None:
         query = f"{artist} {title}" if artist else title
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import asyncio
+import os
 import sys
 import tempfile
+from collections import deque
 from pathlib import Path
 
 import structlog
@@ -19,6 +21,9 @@ _TARGET_HEADROOM = 0.94
 _MIN_BITRATE_KBPS = 64
 _MAX_BITRATE_KBPS = 192
 
+# Lines of yt-dlp stderr kept for the error message; the rest is logged and dropped.
+_STDERR_TAIL_LINES = 32
+
 
 def _target_bitrate_kbps(duration_sec: float, max_bytes: int) -> int:
     """Pick an mp3 bitrate (kbps) that keeps a file of the given duration under
@@ -37,16 +42,17 @@ class YTDownloader:
         download_dir: str | None = None,
         cookies_file: str = "",
         max_upload_mb: int = 50,
+        max_concurrent: int = 3,
     ) -> None:
         self._download_dir = download_dir or tempfile.mkdtemp(prefix="navaar_")
         self._cookies_file = cookies_file
         self._max_upload_bytes = max_upload_mb * _MB
+        # Caps simultaneous yt-dlp processes across every caller (both pull
+        # directions share this downloader) so a burst can't get us throttled.
+        self._sem = asyncio.Semaphore(max(1, max_concurrent))
         Path(self._download_dir).mkdir(parents=True, exist_ok=True)
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=2, max=30))
-    async def download(self, video_id: str) -> str:
-        url = f"https://music.youtube.com/watch?v={video_id}"
-        output_template = str(Path(self._download_dir) / f"{video_id}.%(ext)s")
+    def _ytdlp_cmd(self) -> list[str]:
         # Invoke yt-dlp through the running interpreter (`python -m yt_dlp`) rather
         # than the bare `yt-dlp` console script: the latter only resolves when the
         # venv's bin dir is on PATH, which it isn't when the app is launched via the
@@ -59,46 +65,108 @@ class YTDownloader:
             "--audio-quality", "0",
             "--embed-thumbnail",
             "--add-metadata",
-            "--output", output_template,
+            # Files land at a predictable <download_dir>/<video id>.mp3 (see
+            # _expected_path); the mp3 postprocessor keeps the stem.
+            "--paths", self._download_dir,
+            "--output", "%(id)s.%(ext)s",
             "--no-playlist",
             "--quiet",
+            # Have yt-dlp report where each file finally landed (after the mp3
+            # conversion) on its own stdout line, so we don't have to go looking.
+            "--print", "after_move:filepath",
             "--js-runtimes", "node",
             "--remote-components", "ejs:github",
         ]
-
         if self._cookies_file and Path(self._cookies_file).exists():
             cmd.extend(["--cookies", self._cookies_file])
+        return cmd
 
+    @staticmethod
+    async def _drain(
+        stream: asyncio.StreamReader, sink: list[str] | deque[str], log_event: str = ""
+    ) -> None:
+        async for raw in stream:
+            line = raw.decode(errors="replace").rstrip()
+            if line:
+                sink.append(line)
+                if log_event:
+                    logger.debug(log_event, line=line)
+
+    async def _run_ytdlp(self, cmd: list[str]) -> tuple[int, list[Path], str]:
+        """Run yt-dlp, reading its output as it arrives rather than buffering it
+        all until exit. Returns (returncode, printed file paths, stderr tail)."""
+        async with self._sem:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            printed: list[str] = []  # --print after_move:filepath, one path per line
+            tail: deque[str] = deque(maxlen=_STDERR_TAIL_LINES)
+            await asyncio.gather(
+                self._drain(proc.stdout, printed),
+                self._drain(proc.stderr, tail, "yt_dlp_stderr"),
+            )
+            returncode = await proc.wait()
+        return returncode, [Path(p) for p in printed], "\n".join(tail)
+
+    def _expected_path(self, video_id: str) -> Path:
+        return Path(self._download_dir) / f"{video_id}.mp3"
+
+    @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=2, max=30))
+    async def download(self, video_id: str) -> str:
+        url = f"https://music.youtube.com/watch?v={video_id}"
+        cmd = self._ytdlp_cmd()
         cmd.append(url)
 
         logger.info("yt_download_start", video_id=video_id)
-        proc = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        stdout, stderr = await proc.communicate()
+        returncode, printed, error = await self._run_ytdlp(cmd)
 
-        if proc.returncode != 0:
-            error = stderr.decode().strip()
+        if returncode != 0:
             logger.error("yt_download_failed", video_id=video_id, error=error)
             raise RuntimeError(f"yt-dlp failed for {video_id}: {error}")
 
-        # Find the output file
-        output_path = Path(self._download_dir) / f"{video_id}.mp3"
+        # Trust the path yt-dlp printed; without one, the name is still known.
+        output_path = printed[-1] if printed else self._expected_path(video_id)
         if not output_path.exists():
-            # yt-dlp might have used a different extension before converting
-            candidates = list(Path(self._download_dir).glob(f"{video_id}.*"))
-            if candidates:
-                output_path = candidates[0]
-            else:
-                raise FileNotFoundError(f"Downloaded file not found for {video_id}")
+            raise FileNotFoundError(f"Downloaded file not found for {video_id}")
 
         output_path = await self._fit_upload_limit(output_path)
 
         logger.info("yt_download_complete", video_id=video_id, path=str(output_path))
         return str(output_path)
 
+    async def download_many(self, video_ids: list[str]) -> dict[str, str]:
+        """Download several videos with a single yt-dlp process, paying the
+        interpreter + yt-dlp import startup once instead of per video.
+
+        Best-effort and unretried: returns ``{video_id: path}`` for the videos that
+        landed. Callers fall back to :meth:`download` (which retries) for the rest.
+        """
+        if not video_ids:
+            return {}
+        cmd = self._ytdlp_cmd()
+        cmd.extend(["--concurrent-fragments", "4"])
+        cmd.extend(f"https://music.youtube.com/watch?v={v}" for v in video_ids)
+
+        logger.info("yt_batch_download_start", count=len(video_ids))
+        returncode, printed_paths, error = await self._run_ytdlp(cmd)
+        if returncode != 0:
+            # yt-dlp moves on to the next URL after a failure and exits non-zero
+            # at the end; whatever did download is still picked up below.
+            logger.warning("yt_batch_download_partial", error=error[-400:])
+
+        # Files are named by video id, so the printed paths map back by stem. A
+        # video with no printed path gets one stat of its expected path.
+        printed = {p.name.split(".", 1)[0]: p for p in printed_paths}
+        paths: dict[str, str] = {}
+        for video_id in video_ids:
+            output_path = printed.get(video_id) or self._expected_path(video_id)
+            if output_path.exists():
+                paths[video_id] = str(await self._fit_upload_limit(output_path))
+        logger.info("yt_batch_download_complete", requested=len(video_ids), downloaded=len(paths))
+        return paths
+
     async def _fit_upload_limit(self, path: Path) -> Path:
         """If the file is over the upload limit, re-encode it to a lower mp3
         bitrate that fits and return the new path (deleting the oversized
@@ -169,6 +237,8 @@ class YTDownloader:
 
     def cleanup(self, file_path: str) -> None:
         try:
-            Path(file_path).unlink(missing_ok=True)
+            os.unlink(file_path)
+        except FileNotFoundError:
+            pass
         except OSError:
             logger.debug("cleanup_failed", path=file_path, exc_info=True)
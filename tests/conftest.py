@@ -1,51 +1,142 @@
 from __future__ import annotations
 
+from collections.abc import Awaitable, Callable
 from unittest.mock import MagicMock
 
 import pytest
+from sqlalchemy import insert, select, text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
 
-from navaar.db.models import Base
+from navaar.db.models import Base, Track
 from navaar.db.repository import SyncLogRepository, SyncStateRepository, TrackRepository
 
 
+@pytest.fixture(scope="session")
+async def db_engine():
+    # One schema for the whole run; _reset_db empties it between tests. StaticPool
+    # hands every session the same single connection, so the in-memory DB needs no
+    # shared cache and no connection is ever opened after the first.
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def session_factory(db_engine) -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(db_engine, expire_on_commit=False)
+
+
+@pytest.fixture(autouse=True)
+async def _reset_db(request: pytest.FixtureRequest):
+    """Empty every table after each test that touched the shared DB: a DELETE per
+    table instead of a fresh engine and CREATE TABLE per test."""
+    yield
+    if "db_engine" not in request.fixturenames:
+        return
+    engine = request.getfixturevalue("db_engine")
+    async with engine.begin() as conn:
+        for table in reversed(Base.metadata.sorted_tables):
+            await conn.execute(table.delete())
+
+
 @pytest.fixture
-async def session_factory():
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+async def engine_session_factory(tmp_path):
+    """A private file-backed engine for tests that drive overlapping sessions.
+
+    The shared fixtures run every session over one StaticPool connection, which
+    serializes them, so they can't exercise concurrent-session behavior such as
+    the pull syncs' concurrent retries. Like production, this engine pools a
+    connection per session."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'navaar.db'}")
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
-    factory = async_sessionmaker(engine, expire_on_commit=False)
-    yield factory
+    yield async_sessionmaker(engine, expire_on_commit=False)
 
     await engine.dispose()
 
 
-@pytest.fixture
-async def track_repo(session_factory: async_sessionmaker[AsyncSession]) -> TrackRepository:
+@pytest.fixture(scope="session")
+def seed_snapshot(db_engine) -> Callable[[str, str], Awaitable[None]]:
+    """Seed a sync_state row straight into the table, skipping the repository's
+    get-then-set round trip. ``value`` is the already-serialized JSON blob."""
+
+    async def seed(key: str, value: str) -> None:
+        async with db_engine.begin() as conn:
+            await conn.execute(
+                text("INSERT OR REPLACE INTO sync_state (key, value) VALUES (:key, :value)"),
+                {"key": key, "value": value},
+            )
+
+    return seed
+
+
+@pytest.fixture(scope="session")
+def bulk_create_tracks(db_engine) -> Callable[[list[dict]], Awaitable[list[int]]]:
+    """Insert track rows in one batched INSERT, skipping the ORM unit of work that
+    TrackRepository.create_track goes through. Returns the new ids in row order."""
+
+    async def create(rows: list[dict]) -> list[int]:
+        async with db_engine.begin() as conn:
+            result = await conn.execute(
+                insert(Track).returning(Track.id, sort_by_parameter_order=True), rows
+            )
+            return list(result.scalars())
+
+    return create
+
+
+@pytest.fixture(scope="session")
+def first_failure_reason(db_engine) -> Callable[[str], Awaitable[str | None]]:
+    """failure_reason of the earliest failed track in a direction (None if none),
+    read as a single column instead of loading Track rows."""
+
+    async def read(direction: str) -> str | None:
+        async with db_engine.connect() as conn:
+            result = await conn.execute(
+                select(Track.failure_reason)
+                .where(Track.direction == direction, Track.status == "failed")
+                .order_by(Track.id)
+                .limit(1)
+            )
+            return result.scalar_one_or_none()
+
+    return read
+
+
+@pytest.fixture(scope="session")
+def track_repo(session_factory: async_sessionmaker[AsyncSession]) -> TrackRepository:
     return TrackRepository(session_factory)
 
 
-@pytest.fixture
-async def sync_state_repo(session_factory: async_sessionmaker[AsyncSession]) -> SyncStateRepository:
+@pytest.fixture(scope="session")
+def sync_state_repo(session_factory: async_sessionmaker[AsyncSession]) -> SyncStateRepository:
     return SyncStateRepository(session_factory)
 
 
-@pytest.fixture
-async def sync_log_repo(session_factory: async_sessionmaker[AsyncSession]) -> SyncLogRepository:
+@pytest.fixture(scope="session")
+def sync_log_repo(session_factory: async_sessionmaker[AsyncSession]) -> SyncLogRepository:
     return SyncLogRepository(session_factory)
 
 
+@pytest.fixture(scope="module")
+def _identify_patch():
+    stub = MagicMock()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("navaar.sync._base_push.identify_track", stub)
+        yield stub
+
+
 @pytest.fixture
-def mock_sp_client() -> MagicMock:
-    client = MagicMock()
-    client.get_playlist_tracks = MagicMock(return_value=[])
-    client.find_best_match = MagicMock(
-        return_value={"id": "sp123", "name": "Hello", "artists": ["Adele"], "uri": "spotify:track:sp123"}
-    )
-    client.is_in_playlist = MagicMock(return_value=False)
-    client.add_to_playlist = MagicMock(return_value=None)
-    client.search_track = MagicMock(return_value=[
-        {"id": "sp123", "name": "Hello", "artists": ["Adele"], "duration_ms": 300000, "uri": "spotify:track:sp123"}
-    ])
-    return client
+def identify_stub(_identify_patch: MagicMock) -> MagicMock:
+    """Stand-in for the push syncs' identify_track, patched once per module; tests
+    set ``.return_value``. Reset per test so nothing carries over."""
+    _identify_patch.reset_mock(return_value=True, side_effect=True)
+    return _identify_patch
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import asyncio
-from unittest.mock import AsyncMock, MagicMock
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 
 import httpx
 import pytest
@@ -15,26 +16,43 @@ def _counter_value(metric, **labels) -> float:
     return metric.labels(**labels)._value.get()
 
 
+def _track_calls(mock: AsyncMock) -> asyncio.Condition:
+    """Make ``mock`` notify a condition on every await, so a test can wait for the
+    engine to reach its N-th cycle instead of sleeping a fixed amount."""
+    cond = asyncio.Condition()
+    inner = mock.side_effect
+
+    async def effect(*args, **kwargs):
+        async with cond:
+            cond.notify_all()
+        if inner is not None:
+            raise inner
+        return mock.return_value
+
+    mock.side_effect = effect
+    return cond
+
+
+async def _wait_for_calls(mock: AsyncMock, cond: asyncio.Condition, times: int = 1) -> None:
+    async with asyncio.timeout(2.0), cond:
+        await cond.wait_for(lambda: mock.await_count >= times)
+
+
 @pytest.fixture
-def mock_tg_to_yt() -> MagicMock:
-    m = MagicMock(spec=["process_pending"])
-    m.process_pending = AsyncMock(return_value=0)
-    return m
+def mock_tg_to_yt() -> SimpleNamespace:
+    return SimpleNamespace(process_pending=AsyncMock(return_value=0))
 
 
 @pytest.fixture
-def mock_yt_to_tg() -> MagicMock:
-    m = MagicMock(spec=["process_new_tracks"])
-    m.process_new_tracks = AsyncMock(return_value=0)
-    return m
+def mock_yt_to_tg() -> SimpleNamespace:
+    return SimpleNamespace(process_new_tracks=AsyncMock(return_value=0))
 
 
-@pytest.mark.asyncio
 async def test_engine_starts_and_stops(
     track_repo: TrackRepository,
     sync_state_repo: SyncStateRepository,
-    mock_tg_to_yt: MagicMock,
-    mock_yt_to_tg: MagicMock,
+    mock_tg_to_yt: SimpleNamespace,
+    mock_yt_to_tg: SimpleNamespace,
 ) -> None:
     engine = SyncEngine(
         sync_modules={"tg_to_yt": mock_tg_to_yt, "yt_to_tg": mock_yt_to_tg},
@@ -43,9 +61,13 @@ async def test_engine_starts_and_stops(
         sync_state=sync_state_repo,
     )
 
-    # Run engine for a short time then stop
+    tg_calls = _track_calls(mock_tg_to_yt.process_pending)
+    yt_calls = _track_calls(mock_yt_to_tg.process_new_tracks)
+
+    # Run engine until both loops have cycled once, then stop
     async def stop_after_delay() -> None:
-        await asyncio.sleep(0.5)
+        await _wait_for_calls(mock_tg_to_yt.process_pending, tg_calls)
+        await _wait_for_calls(mock_yt_to_tg.process_new_tracks, yt_calls)
         engine.request_shutdown()
 
     await asyncio.gather(engine.run(), stop_after_delay())
@@ -55,12 +77,11 @@ async def test_engine_starts_and_stops(
     mock_yt_to_tg.process_new_tracks.assert_called()
 
 
-@pytest.mark.asyncio
 async def test_force_sync(
     track_repo: TrackRepository,
     sync_state_repo: SyncStateRepository,
-    mock_tg_to_yt: MagicMock,
-    mock_yt_to_tg: MagicMock,
+    mock_tg_to_yt: SimpleNamespace,
+    mock_yt_to_tg: SimpleNamespace,
 ) -> None:
     engine = SyncEngine(
         sync_modules={"tg_to_yt": mock_tg_to_yt, "yt_to_tg": mock_yt_to_tg},
@@ -69,10 +90,12 @@ async def test_force_sync(
         sync_state=sync_state_repo,
     )
 
+    calls = _track_calls(mock_tg_to_yt.process_pending)
+
     async def force_and_stop() -> None:
-        await asyncio.sleep(0.2)
+        await _wait_for_calls(mock_tg_to_yt.process_pending, calls)
         engine.force_sync("tg_to_yt")
-        await asyncio.sleep(0.5)
+        await _wait_for_calls(mock_tg_to_yt.process_pending, calls, 2)
         engine.request_shutdown()
 
     await asyncio.gather(engine.run(), force_and_stop())
@@ -80,7 +103,6 @@ async def test_force_sync(
     assert mock_tg_to_yt.process_pending.call_count >= 2
 
 
-@pytest.mark.asyncio
 async def test_cycle_crash_does_not_kill_loop_or_siblings(
     track_repo: TrackRepository,
     sync_state_repo: SyncStateRepository,
@@ -88,10 +110,8 @@ async def test_cycle_crash_does_not_kill_loop_or_siblings(
     # A cycle that throws every iteration must be caught, metered, and must not
     # kill its own loop or stop a sibling direction. This is the exact production
     # incident (a direction crashing on every cycle for an extended period).
-    crasher = MagicMock(spec=["process_pending"])
-    crasher.process_pending = AsyncMock(side_effect=RuntimeError("boom"))
-    healthy = MagicMock(spec=["process_new_tracks"])
-    healthy.process_new_tracks = AsyncMock(return_value=0)
+    crasher = SimpleNamespace(process_pending=AsyncMock(side_effect=RuntimeError("boom")))
+    healthy = SimpleNamespace(process_new_tracks=AsyncMock(return_value=0))
     alerts = AsyncMock()
 
     engine = SyncEngine(
@@ -104,8 +124,12 @@ async def test_cycle_crash_does_not_kill_loop_or_siblings(
 
     before = _counter_value(SYNC_CYCLE_CRASHES, direction="tg_to_yt")
 
+    crash_calls = _track_calls(crasher.process_pending)
+    healthy_calls = _track_calls(healthy.process_new_tracks)
+
     async def stop() -> None:
-        await asyncio.sleep(0.3)
+        await _wait_for_calls(crasher.process_pending, crash_calls, 2)
+        await _wait_for_calls(healthy.process_new_tracks, healthy_calls, 2)
         engine.request_shutdown()
 
     await asyncio.gather(engine.run(), stop())
@@ -116,7 +140,6 @@ async def test_cycle_crash_does_not_kill_loop_or_siblings(
     alerts.record_crash.assert_awaited()  # systemic failure was surfaced
 
 
-@pytest.mark.asyncio
 async def test_auth_error_is_classified_and_metered(
     track_repo: TrackRepository,
     sync_state_repo: SyncStateRepository,
@@ -127,8 +150,7 @@ async def test_auth_error_is_classified_and_metered(
     resp = httpx.Response(401, request=req)
     auth_exc = httpx.HTTPStatusError("401", request=req, response=resp)
 
-    crasher = MagicMock(spec=["process_pending"])
-    crasher.process_pending = AsyncMock(side_effect=auth_exc)
+    crasher = SimpleNamespace(process_pending=AsyncMock(side_effect=auth_exc))
 
     engine = SyncEngine(
         sync_modules={"yt_to_sp": crasher},
@@ -141,8 +163,11 @@ async def test_auth_error_is_classified_and_metered(
     before_auth = _counter_value(AUTH_ERRORS, service="yt")
     before_err = _counter_value(SYNC_ERRORS, direction="yt_to_sp", error_type="auth_error")
 
+    calls = _track_calls(crasher.process_pending)
+
     async def stop() -> None:
-        await asyncio.sleep(0.2)
+        # The third call only happens after the second crash was handled.
+        await _wait_for_calls(crasher.process_pending, calls, 3)
         engine.request_shutdown()
 
     await asyncio.gather(engine.run(), stop())
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import functools
+import inspect
+import itertools
+from collections.abc import Callable, Iterator
+from types import SimpleNamespace
+
+import pytest
+
+from navaar.db.repository import SyncLogRepository
+
+
+class _CallLog:
+    """Call recording + the few assertions the sync tests make on their stubs."""
+
+    def __init__(self, return_value: object = None) -> None:
+        self.return_value = return_value
+        self.calls: list[tuple[tuple, dict]] = []
+
+    def assert_not_called(self) -> None:
+        assert not self.calls, f"expected no calls, got {self.calls}"
+
+    def assert_called_once(self) -> None:
+        assert len(self.calls) == 1, f"expected 1 call, got {len(self.calls)}"
+
+    def assert_called_once_with(self, *args: object, **kwargs: object) -> None:
+        self.assert_called_once()
+        assert self.calls[0] == (args, kwargs), f"{self.calls[0]} != {(args, kwargs)}"
+
+
+class Recorder(_CallLog):
+    """A plain callable that records its calls and returns ``return_value``."""
+
+    def __call__(self, *args: object, **kwargs: object) -> object:
+        self.calls.append((args, kwargs))
+        return self.return_value
+
+
+class AsyncStub(_CallLog):
+    """A lean stand-in for AsyncMock on the hot download/upload call sites: records
+    ``(args, kwargs)`` per call and returns ``return_value`` — or the next item of
+    a ``side_effect`` iterator, or raises a ``side_effect`` exception. With a
+    ``spec`` callable, calls that don't fit its signature raise TypeError."""
+
+    def __init__(
+        self,
+        return_value: object = None,
+        side_effect: BaseException | Iterator | None = None,
+        spec: Callable | None = None,
+    ) -> None:
+        super().__init__(return_value)
+        self.side_effect = side_effect
+        self._signature = inspect.signature(spec) if spec is not None else None
+
+    async def __call__(self, *args: object, **kwargs: object) -> object:
+        if self._signature is not None:
+            self._signature.bind(*args, **kwargs)
+        self.calls.append((args, kwargs))
+        if isinstance(self.side_effect, BaseException):
+            raise self.side_effect
+        if self.side_effect is not None:
+            return next(self.side_effect)
+        return self.return_value
+
+
+# The client doubles are SimpleNamespaces holding just the methods the syncs call;
+# tests override one by assigning a MagicMock/AsyncMock to the attribute.
+
+
+@pytest.fixture
+def mock_tg_client() -> SimpleNamespace:
+    # Covers both roles: the pull syncs upload (send_audio), the push syncs
+    # download the channel audio (download_file) and clean it up.
+    return SimpleNamespace(
+        send_audio=AsyncStub(return_value=42),
+        download_file=AsyncStub(return_value="/tmp/test.mp3"),
+        cleanup=Recorder(),
+    )
+
+
+@pytest.fixture
+def mock_tg_client_multi(mock_tg_client: SimpleNamespace) -> SimpleNamespace:
+    """For tests that upload several tracks: message ids are unique per track."""
+    mock_tg_client.send_audio = AsyncStub(side_effect=itertools.count(42))
+    return mock_tg_client
+
+
+@pytest.fixture
+def mock_yt_client() -> SimpleNamespace:
+    return SimpleNamespace(
+        get_playlist_tracks=Recorder([]),
+        find_best_match=Recorder({"videoId": "abc123", "title": "Hello"}),
+        get_playlist_id_set=Recorder(frozenset()),
+        add_to_playlist=Recorder("ok"),
+    )
+
+
+@pytest.fixture
+def mock_sp_client() -> SimpleNamespace:
+    return SimpleNamespace(
+        get_playlist_tracks=Recorder([]),
+        find_best_match=Recorder(
+            {"id": "sp123", "name": "Hello", "artists": ["Adele"], "uri": "spotify:track:sp123"}
+        ),
+        get_playlist_id_set=Recorder(frozenset()),
+        add_to_playlist=Recorder(None),
+        search_track=Recorder([
+            {
+                "id": "sp123",
+                "name": "Hello",
+                "artists": ["Adele"],
+                "duration_ms": 300000,
+                "uri": "spotify:track:sp123",
+            }
+        ]),
+    )
+
+
+@pytest.fixture
+def mock_downloader() -> SimpleNamespace:
+    return SimpleNamespace(
+        download=AsyncStub(return_value="/tmp/vid1.mp3"),
+        download_many=AsyncStub(return_value={}),
+        cleanup=Recorder(),
+    )
+
+
+@pytest.fixture
+def noop_sync_log_repo() -> SimpleNamespace:
+    """Stands in for SyncLogRepository without touching the DB: ``log`` records
+    the call instead of inserting a row, and rejects arguments the real
+    ``SyncLogRepository.log`` wouldn't accept."""
+    # partial(..., None) binds ``self`` so the spec is the bound-method signature.
+    return SimpleNamespace(log=AsyncStub(spec=functools.partial(SyncLogRepository.log, None)))
+
@@ -208,14 +208,14 @@ async def test_compact_summarizes_and_reseeds(track_repo, tmp_path) -> None:
 def test_yt_remove_from_playlist_deletes_by_set_video_id() -> None:
     inst = object.__new__(YTMusicClient)
     inst._playlist_id = "PL"
-    inst._headers = lambda: {"Authorization": "Bearer x"}
     resp = MagicMock(raise_for_status=MagicMock())
-    with patch("navaar.ytmusic.client.httpx.delete", return_value=resp) as deleter:
-        ok = inst.remove_from_playlist(
-            "VID", playlist_tracks=[{"videoId": "VID", "setVideoId": "SET123"}]
-        )
+    http = MagicMock(delete=MagicMock(return_value=resp))
+    inst._api = lambda: http
+    ok = inst.remove_from_playlist(
+        "VID", playlist_tracks=[{"videoId": "VID", "setVideoId": "SET123"}]
+    )
     assert ok is True
-    assert deleter.call_args.kwargs["params"] == {"id": "SET123"}
+    assert http.delete.call_args.kwargs["params"] == {"id": "SET123"}
 
 
 def test_sp_remove_from_playlist_calls_spotipy() -> None:
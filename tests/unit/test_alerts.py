@@ -3,7 +3,6 @@ from __future__ import annotations
 from unittest.mock import AsyncMock
 
 import httpx
-import pytest
 
 from navaar.telegram.alerts import AlertNotifier
 
@@ -20,7 +19,6 @@ def _auth_exc() -> httpx.HTTPStatusError:
     return httpx.HTTPStatusError("invalid_grant: revoked", request=req, response=resp)
 
 
-@pytest.mark.asyncio
 async def test_generic_crash_alerts_only_after_threshold():
     bot = _bot()
     n = AlertNotifier(bot, chat_id=123, consecutive_threshold=2)
@@ -32,7 +30,6 @@ async def test_generic_crash_alerts_only_after_threshold():
     bot.send_message.assert_awaited_once()  # second crash: fires
 
 
-@pytest.mark.asyncio
 async def test_auth_error_escalates_on_first_crash():
     bot = _bot()
     n = AlertNotifier(bot, chat_id=123, consecutive_threshold=2)
@@ -42,7 +39,6 @@ async def test_auth_error_escalates_on_first_crash():
     assert "AUTH" in bot.send_message.call_args.kwargs["text"]
 
 
-@pytest.mark.asyncio
 async def test_no_spam_while_incident_open():
     bot = _bot()
     n = AlertNotifier(bot, chat_id=123, consecutive_threshold=1, cooldown_seconds=10_000)
@@ -54,7 +50,6 @@ async def test_no_spam_while_incident_open():
     assert bot.send_message.await_count == 1
 
 
-@pytest.mark.asyncio
 async def test_recovery_sends_resolved_then_resets():
     bot = _bot()
     n = AlertNotifier(bot, chat_id=123, consecutive_threshold=1)
@@ -71,7 +66,6 @@ async def test_recovery_sends_resolved_then_resets():
     assert bot.send_message.await_count == 2
 
 
-@pytest.mark.asyncio
 async def test_disabled_when_no_chat_id():
     bot = _bot()
     n = AlertNotifier(bot, chat_id=None)
@@ -79,7 +73,6 @@ async def test_disabled_when_no_chat_id():
     bot.send_message.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_send_failure_never_raises():
     bot = _bot()
     bot.send_message = AsyncMock(side_effect=RuntimeError("telegram down"))
@@ -1,10 +1,9 @@
 from __future__ import annotations
 
 import asyncio
+from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock
 
-import pytest
-
 from navaar.telegram.bot import NavaarBot
 
 
@@ -51,7 +50,6 @@ def test_menu_commands_match_registered_handlers() -> None:
         assert cmd.command in registered, f"menu command /{cmd.command} has no handler"
 
 
-@pytest.mark.asyncio
 async def test_set_command_menu_registers_per_admin_scope() -> None:
     bot = _make_bot()
     await bot.set_command_menu()
@@ -64,7 +62,6 @@ async def test_set_command_menu_registers_per_admin_scope() -> None:
     assert scopes == {111, 222}
 
 
-@pytest.mark.asyncio
 async def test_set_command_menu_swallows_errors() -> None:
     bot = _make_bot()
     bot._app.bot.set_my_commands = AsyncMock(side_effect=RuntimeError("chat not found"))
@@ -72,7 +69,6 @@ async def test_set_command_menu_swallows_errors() -> None:
     await bot.set_command_menu()
 
 
-@pytest.mark.asyncio
 async def test_set_command_menu_noop_without_app() -> None:
     bot = _make_bot()
     bot._app = None
@@ -88,7 +84,6 @@ def _channel_msg(text: str, *, reply_to: int | None = None) -> MagicMock:
     return msg
 
 
-@pytest.mark.asyncio
 async def test_channel_mention_without_reply_runs_agent() -> None:
     # A standalone @mention (no reply) is a channel-wide request, e.g. duplicates.
     bot = _make_bot(sp_client=MagicMock())
@@ -101,7 +96,6 @@ async def test_channel_mention_without_reply_runs_agent() -> None:
     msg.reply_text.assert_awaited_once()
 
 
-@pytest.mark.asyncio
 async def test_channel_mention_reply_passes_track_context() -> None:
     bot = _make_bot(sp_client=MagicMock())
     bot._bot_username = "navbot"
@@ -115,7 +109,6 @@ async def test_channel_mention_reply_passes_track_context() -> None:
     assert bot._agent.run.await_args.kwargs["siblings"] == ["sib"]
 
 
-@pytest.mark.asyncio
 async def test_channel_text_without_mention_ignored() -> None:
     bot = _make_bot(sp_client=MagicMock())
     bot._bot_username = "navbot"
@@ -129,7 +122,6 @@ def _dm_update(uid: int = 111) -> MagicMock:
     return MagicMock(message=MagicMock(reply_text=AsyncMock()), effective_user=MagicMock(id=uid))
 
 
-@pytest.mark.asyncio
 async def test_dm_posts_placeholder_typing_and_deletes() -> None:
     # An admin DM should: post a placeholder, keep the typing action alive, run the
     # agent, delete the placeholder, then send the real answer.
@@ -159,7 +151,6 @@ async def test_dm_posts_placeholder_typing_and_deletes() -> None:
     assert message.reply_text.await_args_list[-1].args[0] == "the answer"
 
 
-@pytest.mark.asyncio
 async def test_dm_still_replies_when_placeholder_fails() -> None:
     # If posting the placeholder or the typing action errors, the real answer must
     # still be delivered.
@@ -178,7 +169,6 @@ async def test_dm_still_replies_when_placeholder_fails() -> None:
     assert message.reply_text.await_args_list[-1].args[0] == "done"
 
 
-@pytest.mark.asyncio
 async def test_cmd_context_calls_agent() -> None:
     bot = _make_bot(sp_client=MagicMock())
     bot._agent = MagicMock(context_info=AsyncMock(return_value="ctx readout"))
@@ -188,7 +178,6 @@ async def test_cmd_context_calls_agent() -> None:
     upd.message.reply_text.assert_awaited_once()
 
 
-@pytest.mark.asyncio
 async def test_cmd_reset_non_admin_ignored() -> None:
     bot = _make_bot(sp_client=MagicMock())
     bot._agent = MagicMock(reset=AsyncMock())
@@ -196,7 +185,6 @@ async def test_cmd_reset_non_admin_ignored() -> None:
     bot._agent.reset.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_channel_control_command_intercepted() -> None:
     # "@bot /reset" in the channel runs the control, not the agent.
     bot = _make_bot(sp_client=MagicMock())
@@ -209,3 +197,120 @@ async def test_channel_control_command_intercepted() -> None:
     bot._agent.reset.assert_awaited_once()
     bot._agent.run.assert_not_called()
     msg.reply_text.assert_awaited_once()
+
+
+async def test_cmd_stats_renders_success_bar() -> None:
+    bot = _make_bot()
+    bot._tracks = MagicMock(get_stats=AsyncMock(return_value={
+        "total": 4, "synced": 2, "failed": 2, "duplicates": 0, "pending": 0,
+        "success_rate": 50.0, "tg_to_yt_synced": 1, "yt_to_tg_synced": 1,
+    }))
+    upd = _dm_update(111)
+    await bot._cmd_stats(upd, MagicMock())
+    text = upd.message.reply_text.await_args.args[0]
+    assert "[██████░░░░░░]" in text
+
+
+def test_ago_from_ts_buckets() -> None:
+    from navaar.telegram.bot import _ago_from_ts
+
+    assert _ago_from_ts(1000.0, 970.0) == "30s ago"
+    assert _ago_from_ts(10_000.0, 10_000.0 - 125) == "2m ago"
+    assert _ago_from_ts(100_000.0, 100_000.0 - 7200) == "2h ago"
+    assert _ago_from_ts(1_000_000.0, 1_000_000.0 - 3 * 86400) == "3d ago"
+
+
+async def test_cmd_logs_renders_one_line_per_entry() -> None:
+    bot = _make_bot()
+    now = datetime.now(UTC).replace(tzinfo=None)
+    entries = [
+        MagicMock(track_id=7, event="track_synced", direction="tg_to_yt", created_at=now),
+        MagicMock(track_id=None, event="cycle", direction=None, created_at=now),
+    ]
+    bot._log = MagicMock(get_recent_logs=AsyncMock(return_value=entries))
+    upd = _dm_update(111)
+    await bot._cmd_logs(upd, MagicMock(args=[]))
+    text = upd.message.reply_text.await_args.args[0]
+    header, body = text.split("\n\n", 1)
+    assert "Recent Logs (last 2)" in header
+    lines = body.split("\n")
+    assert len(lines) == 2
+    assert lines[0].startswith("<code>   #7</code> track_synced")
+    assert lines[1].startswith("<code>    -</code> cycle")
+
+
+def test_status_keyboard_built_once_with_sp_row() -> None:
+    bot = _make_bot(sp_client=MagicMock())
+    data = [b.callback_data for row in bot._status_kb.inline_keyboard for b in row]
+    assert "sync_sp_to_tg" in data and "show_failed" in data
+    plain = _make_bot(sp_client=None)
+    assert "sync_sp_to_tg" not in [
+        b.callback_data for row in plain._status_kb.inline_keyboard for b in row
+    ]
+
+
+def _callback_update(data: str, uid: int = 111) -> MagicMock:
+    query = MagicMock(
+        data=data,
+        from_user=MagicMock(id=uid),
+        answer=AsyncMock(),
+        message=MagicMock(reply_text=AsyncMock()),
+    )
+    return MagicMock(callback_query=query)
+
+
+async def test_callback_sync_button_forces_direction() -> None:
+    bot = _make_bot()
+    bot._engine = MagicMock()
+    upd = _callback_update("sync_yt_to_tg")
+    await bot._handle_callback(upd, MagicMock())
+    bot._engine.force_sync.assert_called_once_with("yt_to_tg")
+
+
+async def test_callback_retry_all_is_not_parsed_as_track_id() -> None:
+    bot = _make_bot()
+    bot._tracks = MagicMock(reset_all_failed=AsyncMock(return_value=3), get_track=AsyncMock())
+    await bot._handle_callback(_callback_update("retry_all"), MagicMock())
+    bot._tracks.reset_all_failed.assert_awaited_once_with()
+    bot._tracks.get_track.assert_not_called()
+
+
+async def test_callback_prefix_routes_track_id() -> None:
+    bot = _make_bot()
+    bot._tracks = MagicMock(delete_track=AsyncMock(return_value=True))
+    await bot._handle_callback(_callback_update("delete_42"), MagicMock())
+    bot._tracks.delete_track.assert_awaited_once_with(42)
+
+
+async def test_search_runs_off_loop_and_caches_results() -> None:
+    yt = MagicMock()
+    yt.search_song = MagicMock(return_value=[
+        {"videoId": "v1", "title": "Hello", "artists": [{"name": "Adele"}]},
+    ])
+    bot = _make_bot()
+    bot._yt = yt
+    for _ in range(2):
+        upd = _dm_update(111)
+        await bot._cmd_search(upd, MagicMock(args=["adele", "hello"]))
+        assert "<code>v1</code>" in upd.message.reply_text.await_args.args[0]
+    yt.search_song.assert_called_once_with("adele hello", limit=5)
+
+
+async def test_help_text_prerendered_per_spotify_mode() -> None:
+    assert "/search_sp" in _make_bot(sp_client=MagicMock())._help_text
+    bot = _make_bot(sp_client=None)
+    assert "/search_sp" not in bot._help_text
+    upd = _dm_update(111)
+    await bot._cmd_help(upd, MagicMock())
+    assert upd.message.reply_text.await_args.args[0] is bot._help_text
+
+
+def test_chunk_html_splits_on_line_boundaries() -> None:
+    from navaar.telegram.bot import _chunk_html
+
+    lines = [f"<b>{i:03d}</b>" + "x" * 90 for i in range(100)]
+    chunks = list(_chunk_html(lines, cap=1000))
+    assert len(chunks) > 1
+    assert all(len(c) <= 1000 for c in chunks)
+    assert "\n".join(chunks) == "\n".join(lines)
+    assert list(_chunk_html(["short"])) == ["short"]
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from tenacity import stop_after_attempt
 
 from navaar.ytmusic.downloader import (
     _MAX_BITRATE_KBPS,
@@ -18,6 +20,18 @@ def _write(path: str, data: bytes) -> None:
     Path(path).write_bytes(data)
 
 
+def _ytdlp_proc(stdout: bytes = b"", stderr: bytes = b"", returncode: int = 0) -> MagicMock:
+    """A fake yt-dlp process whose output is read from its pipes as streams."""
+    proc = MagicMock()
+    for name, data in (("stdout", stdout), ("stderr", stderr)):
+        reader = asyncio.StreamReader()
+        reader.feed_data(data)
+        reader.feed_eof()
+        setattr(proc, name, reader)
+    proc.wait = AsyncMock(return_value=returncode)
+    return proc
+
+
 def test_target_bitrate_long_track_fits_under_limit() -> None:
     # ~60 min at the 50 MiB limit should land in a normal mp3 range and, crucially,
     # produce a file under the cap.
@@ -42,7 +56,6 @@ def test_target_bitrate_unknown_duration_uses_floor() -> None:
     assert _target_bitrate_kbps(0, 50 * _MB) == _MIN_BITRATE_KBPS
 
 
-@pytest.mark.asyncio
 async def test_fit_upload_limit_skips_small_files(tmp_path: Path) -> None:
     dl = YTDownloader(download_dir=str(tmp_path), max_upload_mb=50)
     f = tmp_path / "small.mp3"
@@ -55,7 +68,6 @@ async def test_fit_upload_limit_skips_small_files(tmp_path: Path) -> None:
     spawn.assert_not_called()  # no ffprobe/ffmpeg for a file under the limit
 
 
-@pytest.mark.asyncio
 async def test_fit_upload_limit_compresses_oversized(tmp_path: Path) -> None:
     dl = YTDownloader(download_dir=str(tmp_path), max_upload_mb=50)
     big = tmp_path / "vid.mp3"
@@ -83,7 +95,6 @@ async def test_fit_upload_limit_compresses_oversized(tmp_path: Path) -> None:
     assert result.name.endswith(f".{_MIN_BITRATE_KBPS}k.mp3")
 
 
-@pytest.mark.asyncio
 async def test_fit_upload_limit_keeps_original_on_failure(tmp_path: Path) -> None:
     dl = YTDownloader(download_dir=str(tmp_path), max_upload_mb=50)
     big = tmp_path / "vid.mp3"
@@ -104,3 +115,105 @@ async def test_fit_upload_limit_keeps_original_on_failure(tmp_path: Path) -> Non
 
     assert result == big  # falls back to the original so the failure is visible
     assert big.exists()
+
+
+async def test_download_many_single_process_returns_found(tmp_path: Path) -> None:
+    dl = YTDownloader(download_dir=str(tmp_path), max_upload_mb=50)
+    spawned: list[tuple] = []
+
+    async def fake_ytdlp(*cmd, **kwargs):
+        spawned.append(cmd)
+        (tmp_path / "aaa.mp3").write_bytes(b"x")  # bbb failed to download
+        return _ytdlp_proc(stderr=b"ERROR: bbb unavailable\n", returncode=1)
+
+    with patch(
+        "navaar.ytmusic.downloader.asyncio.create_subprocess_exec", side_effect=fake_ytdlp
+    ):
+        paths = await dl.download_many(["aaa", "bbb"])
+
+    assert len(spawned) == 1
+    assert spawned[0][-2:] == (
+        "https://music.youtube.com/watch?v=aaa",
+        "https://music.youtube.com/watch?v=bbb",
+    )
+    assert paths == {"aaa": str(tmp_path / "aaa.mp3")}
+
+
+async def test_download_uses_printed_filepath(tmp_path: Path) -> None:
+    dl = YTDownloader(download_dir=str(tmp_path), max_upload_mb=50)
+    final = tmp_path / "elsewhere.mp3"
+
+    async def fake_ytdlp(*cmd, **kwargs):
+        assert "after_move:filepath" in cmd
+        final.write_bytes(b"x")
+        return _ytdlp_proc(stdout=f"{final}\n".encode())
+
+    with patch(
+        "navaar.ytmusic.downloader.asyncio.create_subprocess_exec", side_effect=fake_ytdlp
+    ):
+        path = await dl.download("vid")
+
+    assert path == str(final)  # the reported path wins over the expected name
+
+
+async def test_download_falls_back_to_expected_path(tmp_path: Path) -> None:
+    dl = YTDownloader(download_dir=str(tmp_path), max_upload_mb=50)
+
+    async def fake_ytdlp(*cmd, **kwargs):
+        assert cmd[cmd.index("--paths") + 1] == str(tmp_path)
+        (tmp_path / "vid.mp3").write_bytes(b"x")
+        return _ytdlp_proc()  # printed nothing
+
+    with patch(
+        "navaar.ytmusic.downloader.asyncio.create_subprocess_exec", side_effect=fake_ytdlp
+    ):
+        path = await dl.download("vid")
+
+    assert path == str(tmp_path / "vid.mp3")
+
+
+async def test_download_concurrency_is_bounded(tmp_path: Path) -> None:
+    dl = YTDownloader(download_dir=str(tmp_path), max_upload_mb=50, max_concurrent=2)
+    running = peak = 0
+
+    async def fake_ytdlp(*cmd, **kwargs):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        out = tmp_path / f"{cmd[-1].rsplit('=', 1)[1]}.mp3"
+        out.write_bytes(b"x")
+
+        async def wait() -> int:
+            nonlocal running
+            await asyncio.sleep(0.01)
+            running -= 1
+            return 0
+
+        proc = _ytdlp_proc(stdout=f"{out}\n".encode())
+        proc.wait = wait
+        return proc
+
+    with patch(
+        "navaar.ytmusic.downloader.asyncio.create_subprocess_exec", side_effect=fake_ytdlp
+    ):
+        paths = await asyncio.gather(*(dl.download(v) for v in ("a", "b", "c", "d")))
+
+    assert len(paths) == 4
+    assert peak == 2
+
+
+async def test_download_failure_reports_stderr_tail(tmp_path: Path) -> None:
+    dl = YTDownloader(download_dir=str(tmp_path), max_upload_mb=50)
+    noise = b"".join(f"WARNING: line {i}\n".encode() for i in range(100))
+    proc = _ytdlp_proc(stderr=noise + b"ERROR: Video unavailable\n", returncode=1)
+
+    with patch(
+        "navaar.ytmusic.downloader.asyncio.create_subprocess_exec",
+        AsyncMock(return_value=proc),
+    ), pytest.raises(RuntimeError) as exc:
+        await dl.download.retry_with(stop=stop_after_attempt(1), reraise=True)(dl, "vid")
+
+    msg = str(exc.value)
+    assert msg.endswith("ERROR: Video unavailable")
+    assert "line 99" in msg
+    assert "line 0\n" not in msg  # only the tail is retained
@@ -2,14 +2,12 @@ from __future__ import annotations
 
 import time
 
-import pytest
 from fastapi.testclient import TestClient
 
 from navaar.api.server import create_app
 from navaar.db.repository import SyncStateRepository, TrackRepository
 
 
-@pytest.mark.asyncio
 async def test_readyz_ok_when_recent(
     track_repo: TrackRepository, sync_state_repo: SyncStateRepository
 ) -> None:
@@ -28,7 +26,6 @@ async def test_readyz_ok_when_recent(
     assert resp.json()["status"] == "ok"
 
 
-@pytest.mark.asyncio
 async def test_readyz_degraded_when_stale(
     track_repo: TrackRepository, sync_state_repo: SyncStateRepository
 ) -> None:
@@ -50,7 +47,6 @@ async def test_readyz_degraded_when_stale(
     assert "tg_to_yt" in body["stale"]
 
 
-@pytest.mark.asyncio
 async def test_readyz_grace_at_startup(
     track_repo: TrackRepository, sync_state_repo: SyncStateRepository
 ) -> None:
@@ -1,11 +1,10 @@
 from __future__ import annotations
 
-import pytest
+from collections.abc import Awaitable, Callable
 
 from navaar.db.repository import SyncStateRepository, TrackRepository
 
 
-@pytest.mark.asyncio
 async def test_create_and_get_track(track_repo: TrackRepository) -> None:
     track = await track_repo.create_track(
         direction="tg_to_yt",
@@ -25,7 +24,6 @@ async def test_create_and_get_track(track_repo: TrackRepository) -> None:
     assert fetched.title == "Hello"
 
 
-@pytest.mark.asyncio
 async def test_get_track_by_tg_file_unique_id(track_repo: TrackRepository) -> None:
     await track_repo.create_track(
         direction="tg_to_yt",
@@ -41,7 +39,6 @@ async def test_get_track_by_tg_file_unique_id(track_repo: TrackRepository) -> No
     assert not_found is None
 
 
-@pytest.mark.asyncio
 async def test_get_track_by_yt_video_id(track_repo: TrackRepository) -> None:
     await track_repo.create_track(
         direction="yt_to_tg",
@@ -54,12 +51,16 @@ async def test_get_track_by_yt_video_id(track_repo: TrackRepository) -> None:
     assert found.title == "Song"
 
 
-@pytest.mark.asyncio
-async def test_get_pending_tracks(track_repo: TrackRepository) -> None:
-    await track_repo.create_track(direction="tg_to_yt", status="pending", title="A")
-    await track_repo.create_track(direction="tg_to_yt", status="synced", title="B")
-    await track_repo.create_track(direction="tg_to_yt", status="retry_scheduled", title="C")
-    await track_repo.create_track(direction="yt_to_tg", status="pending", title="D")
+async def test_get_pending_tracks(
+    track_repo: TrackRepository,
+    bulk_create_tracks: Callable[[list[dict]], Awaitable[list[int]]],
+) -> None:
+    await bulk_create_tracks([
+        {"direction": "tg_to_yt", "status": "pending", "title": "A"},
+        {"direction": "tg_to_yt", "status": "synced", "title": "B"},
+        {"direction": "tg_to_yt", "status": "retry_scheduled", "title": "C"},
+        {"direction": "yt_to_tg", "status": "pending", "title": "D"},
+    ])
 
     pending = await track_repo.get_pending_tracks("tg_to_yt")
     assert len(pending) == 2
@@ -67,7 +68,6 @@ async def test_get_pending_tracks(track_repo: TrackRepository) -> None:
     assert titles == {"A", "C"}
 
 
-@pytest.mark.asyncio
 async def test_mark_synced(track_repo: TrackRepository) -> None:
     track = await track_repo.create_track(direction="tg_to_yt", status="pending", title="X")
     updated = await track_repo.mark_synced(track.id, yt_video_id="vid123")
@@ -76,7 +76,6 @@ async def test_mark_synced(track_repo: TrackRepository) -> None:
     assert updated.yt_video_id == "vid123"
 
 
-@pytest.mark.asyncio
 async def test_mark_failed_and_retry(track_repo: TrackRepository) -> None:
     track = await track_repo.create_track(direction="tg_to_yt", status="pending", title="X")
     failed = await track_repo.mark_failed(track.id, "no_yt_match")
@@ -89,18 +88,21 @@ async def test_mark_failed_and_retry(track_repo: TrackRepository) -> None:
     assert retried.failure_reason is None
 
 
-@pytest.mark.asyncio
 async def test_mark_duplicate(track_repo: TrackRepository) -> None:
     track = await track_repo.create_track(direction="tg_to_yt", status="pending", title="X")
     updated = await track_repo.mark_duplicate(track.id)
     assert updated.status == "duplicate"
 
 
-@pytest.mark.asyncio
-async def test_get_failed_tracks(track_repo: TrackRepository) -> None:
-    await track_repo.create_track(direction="tg_to_yt", status="failed", title="A")
-    await track_repo.create_track(direction="yt_to_tg", status="failed", title="B")
-    await track_repo.create_track(direction="tg_to_yt", status="synced", title="C")
+async def test_get_failed_tracks(
+    track_repo: TrackRepository,
+    bulk_create_tracks: Callable[[list[dict]], Awaitable[list[int]]],
+) -> None:
+    await bulk_create_tracks([
+        {"direction": "tg_to_yt", "status": "failed", "title": "A"},
+        {"direction": "yt_to_tg", "status": "failed", "title": "B"},
+        {"direction": "tg_to_yt", "status": "synced", "title": "C"},
+    ])
 
     all_failed = await track_repo.get_failed_tracks()
     assert len(all_failed) == 2
@@ -110,11 +112,15 @@ async def test_get_failed_tracks(track_repo: TrackRepository) -> None:
     assert tg_failed[0].title == "A"
 
 
-@pytest.mark.asyncio
-async def test_reset_all_failed(track_repo: TrackRepository) -> None:
-    await track_repo.create_track(direction="tg_to_yt", status="failed", title="A")
-    await track_repo.create_track(direction="tg_to_yt", status="failed", title="B")
-    await track_repo.create_track(direction="yt_to_tg", status="failed", title="C")
+async def test_reset_all_failed(
+    track_repo: TrackRepository,
+    bulk_create_tracks: Callable[[list[dict]], Awaitable[list[int]]],
+) -> None:
+    await bulk_create_tracks([
+        {"direction": "tg_to_yt", "status": "failed", "title": "A"},
+        {"direction": "tg_to_yt", "status": "failed", "title": "B"},
+        {"direction": "yt_to_tg", "status": "failed", "title": "C"},
+    ])
 
     count = await track_repo.reset_all_failed("tg_to_yt")
     assert count == 2
@@ -124,12 +130,16 @@ async def test_reset_all_failed(track_repo: TrackRepository) -> None:
     assert remaining[0].title == "C"
 
 
-@pytest.mark.asyncio
-async def test_get_counts(track_repo: TrackRepository) -> None:
-    await track_repo.create_track(direction="tg_to_yt", status="synced", title="A")
-    await track_repo.create_track(direction="tg_to_yt", status="synced", title="B")
-    await track_repo.create_track(direction="tg_to_yt", status="failed", title="C")
-    await track_repo.create_track(direction="yt_to_tg", status="pending", title="D")
+async def test_get_counts(
+    track_repo: TrackRepository,
+    bulk_create_tracks: Callable[[list[dict]], Awaitable[list[int]]],
+) -> None:
+    await bulk_create_tracks([
+        {"direction": "tg_to_yt", "status": "synced", "title": "A"},
+        {"direction": "tg_to_yt", "status": "synced", "title": "B"},
+        {"direction": "tg_to_yt", "status": "failed", "title": "C"},
+        {"direction": "yt_to_tg", "status": "pending", "title": "D"},
+    ])
 
     counts = await track_repo.get_counts()
     assert counts["tg_to_yt"]["synced"] == 2
@@ -137,11 +147,15 @@ async def test_get_counts(track_repo: TrackRepository) -> None:
     assert counts["yt_to_tg"]["pending"] == 1
 
 
-@pytest.mark.asyncio
-async def test_get_stats(track_repo: TrackRepository) -> None:
-    await track_repo.create_track(direction="tg_to_yt", status="synced", title="A")
-    await track_repo.create_track(direction="tg_to_yt", status="failed", title="B")
-    await track_repo.create_track(direction="tg_to_yt", status="duplicate", title="C")
+async def test_get_stats(
+    track_repo: TrackRepository,
+    bulk_create_tracks: Callable[[list[dict]], Awaitable[list[int]]],
+) -> None:
+    await bulk_create_tracks([
+        {"direction": "tg_to_yt", "status": "synced", "title": "A"},
+        {"direction": "tg_to_yt", "status": "failed", "title": "B"},
+        {"direction": "tg_to_yt", "status": "duplicate", "title": "C"},
+    ])
 
     stats = await track_repo.get_stats()
     assert stats["total"] == 3
@@ -151,7 +165,6 @@ async def test_get_stats(track_repo: TrackRepository) -> None:
     assert stats["success_rate"] == 33.3
 
 
-@pytest.mark.asyncio
 async def test_sync_state_crud(sync_state_repo: SyncStateRepository) -> None:
     assert await sync_state_repo.get("key1") is None
 
@@ -162,7 +175,6 @@ async def test_sync_state_crud(sync_state_repo: SyncStateRepository) -> None:
     assert await sync_state_repo.get("key1") == "value2"
 
 
-@pytest.mark.asyncio
 async def test_sync_state_json(sync_state_repo: SyncStateRepository) -> None:
     await sync_state_repo.set_json("snapshot", ["vid1", "vid2"])
     result = await sync_state_repo.get_json("snapshot")
@@ -1,61 +1,46 @@
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock
+from collections.abc import Awaitable, Callable, Iterable
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 import pytest
 
-from navaar.db.repository import SyncLogRepository, SyncStateRepository, TrackRepository
+from navaar.db.repository import SyncStateRepository, TrackRepository
 from navaar.sync.sp_to_tg import SpToTgSync
 
+_YTDLP_FAILURE = RuntimeError("yt-dlp failed")
 
-@pytest.fixture
-def mock_tg_client() -> MagicMock:
-    client = MagicMock()
-    client.send_audio = AsyncMock(side_effect=[42, 43, 44, 45])
-    return client
 
-
-@pytest.fixture
-def mock_yt_client() -> MagicMock:
-    client = MagicMock()
-    client.find_best_match = MagicMock(
-        return_value={"videoId": "yt_vid1", "title": "Song One"}
+@pytest.fixture(scope="module")
+def sp_tracks() -> tuple[dict, ...]:
+    # Shared by every test in the module, so keep it immutable where the sync
+    # permits: only the dicts themselves stay dicts (the sync reads them by key).
+    return (
+        {"id": "sp1", "name": "Song One", "artists": ("Artist A",), "duration_ms": 180000, "uri": "spotify:track:sp1"},
+        {"id": "sp2", "name": "Song Two", "artists": ("Artist B",), "duration_ms": 240000, "uri": "spotify:track:sp2"},
     )
-    return client
-
-
-@pytest.fixture
-def mock_downloader() -> MagicMock:
-    dl = MagicMock()
-    dl.download = AsyncMock(return_value="/tmp/vid1.mp3")
-    dl.cleanup = MagicMock()
-    return dl
 
 
-def _make_sp_client(tracks: list[dict]) -> MagicMock:
-    client = MagicMock()
-    client.get_playlist_tracks = MagicMock(return_value=tracks)
-    return client
+def _make_sp_client(tracks: Iterable[dict]) -> SimpleNamespace:
+    return SimpleNamespace(get_playlist_tracks=MagicMock(return_value=list(tracks)))
 
 
-@pytest.mark.asyncio
 async def test_no_new_tracks(
     track_repo: TrackRepository,
     sync_state_repo: SyncStateRepository,
-    sync_log_repo: SyncLogRepository,
-    mock_tg_client: MagicMock,
-    mock_yt_client: MagicMock,
-    mock_downloader: MagicMock,
+    noop_sync_log_repo: SimpleNamespace,
+    seed_snapshot: Callable[[str, str], Awaitable[None]],
+    mock_tg_client: SimpleNamespace,
+    mock_yt_client: SimpleNamespace,
+    mock_downloader: SimpleNamespace,
+    sp_tracks: tuple[dict, ...],
 ) -> None:
-    sp_tracks = [
-        {"id": "sp1", "name": "Song One", "artists": ["Artist A"], "duration_ms": 180000, "uri": "spotify:track:sp1"},
-        {"id": "sp2", "name": "Song Two", "artists": ["Artist B"], "duration_ms": 240000, "uri": "spotify:track:sp2"},
-    ]
     sp_client = _make_sp_client(sp_tracks)
-    await sync_state_repo.set_json("sp_playlist_snapshot", ["sp1", "sp2"])
+    await seed_snapshot("sp_playlist_snapshot", '["sp1", "sp2"]')
 
     sync = SpToTgSync(
-        track_repo, sync_state_repo, sync_log_repo,
+        track_repo, sync_state_repo, noop_sync_log_repo,
         mock_tg_client, sp_client, mock_yt_client, mock_downloader,
     )
     result = await sync.process_new_tracks()
@@ -63,25 +48,22 @@ async def test_no_new_tracks(
     mock_downloader.download.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_new_track_synced(
     track_repo: TrackRepository,
     sync_state_repo: SyncStateRepository,
-    sync_log_repo: SyncLogRepository,
-    mock_tg_client: MagicMock,
-    mock_yt_client: MagicMock,
-    mock_downloader: MagicMock,
+    noop_sync_log_repo: SimpleNamespace,
+    seed_snapshot: Callable[[str, str], Awaitable[None]],
+    mock_tg_client: SimpleNamespace,
+    mock_yt_client: SimpleNamespace,
+    mock_downloader: SimpleNamespace,
+    sp_tracks: tuple[dict, ...],
 ) -> None:
-    sp_tracks = [
-        {"id": "sp1", "name": "Song One", "artists": ["Artist A"], "duration_ms": 180000, "uri": "spotify:track:sp1"},
-        {"id": "sp2", "name": "Song Two", "artists": ["Artist B"], "duration_ms": 240000, "uri": "spotify:track:sp2"},
-    ]
     sp_client = _make_sp_client(sp_tracks)
     # Snapshot only has sp1, so sp2 is new
-    await sync_state_repo.set_json("sp_playlist_snapshot", ["sp1"])
+    await seed_snapshot("sp_playlist_snapshot", '["sp1"]')
 
     sync = SpToTgSync(
-        track_repo, sync_state_repo, sync_log_repo,
+        track_repo, sync_state_repo, noop_sync_log_repo,
         mock_tg_client, sp_client, mock_yt_client, mock_downloader,
     )
     result = await sync.process_new_tracks()
@@ -93,29 +75,27 @@ async def test_new_track_synced(
     assert track.status == "synced"
     assert track.tg_message_id == 42
 
-    mock_downloader.download.assert_called_once_with("yt_vid1")
+    mock_downloader.download.assert_called_once_with("abc123")
     mock_tg_client.send_audio.assert_called_once()
     mock_downloader.cleanup.assert_called_once()
+    logged = [(args[0], kw["direction"]) for args, kw in noop_sync_log_repo.log.calls]
+    assert logged == [("track_synced", "sp_to_tg")]
 
 
-@pytest.mark.asyncio
 async def test_first_run_empty_snapshot(
     track_repo: TrackRepository,
     sync_state_repo: SyncStateRepository,
-    sync_log_repo: SyncLogRepository,
-    mock_tg_client: MagicMock,
-    mock_yt_client: MagicMock,
-    mock_downloader: MagicMock,
+    noop_sync_log_repo: SimpleNamespace,
+    mock_tg_client_multi: SimpleNamespace,
+    mock_yt_client: SimpleNamespace,
+    mock_downloader: SimpleNamespace,
+    sp_tracks: tuple[dict, ...],
 ) -> None:
-    sp_tracks = [
-        {"id": "sp1", "name": "Song One", "artists": ["Artist A"], "duration_ms": 180000, "uri": "spotify:track:sp1"},
-        {"id": "sp2", "name": "Song Two", "artists": ["Artist B"], "duration_ms": 240000, "uri": "spotify:track:sp2"},
-    ]
     sp_client = _make_sp_client(sp_tracks)
     # No snapshot at all
     sync = SpToTgSync(
-        track_repo, sync_state_repo, sync_log_repo,
-        mock_tg_client, sp_client, mock_yt_client, mock_downloader,
+        track_repo, sync_state_repo, noop_sync_log_repo,
+        mock_tg_client_multi, sp_client, mock_yt_client, mock_downloader,
     )
     result = await sync.process_new_tracks()
     assert result == 2
@@ -125,31 +105,28 @@ async def test_first_run_empty_snapshot(
     assert snapshot == ["sp1", "sp2"]
 
 
-@pytest.mark.asyncio
 async def test_download_failure_marks_failed(
     track_repo: TrackRepository,
     sync_state_repo: SyncStateRepository,
-    sync_log_repo: SyncLogRepository,
-    mock_tg_client: MagicMock,
-    mock_yt_client: MagicMock,
-    mock_downloader: MagicMock,
+    noop_sync_log_repo: SimpleNamespace,
+    seed_snapshot: Callable[[str, str], Awaitable[None]],
+    first_failure_reason: Callable[[str], Awaitable[str | None]],
+    mock_tg_client: SimpleNamespace,
+    mock_yt_client: SimpleNamespace,
+    mock_downloader: SimpleNamespace,
+    sp_tracks: tuple[dict, ...],
 ) -> None:
-    mock_downloader.download = AsyncMock(side_effect=RuntimeError("yt-dlp failed"))
-    sp_tracks = [
-        {"id": "sp1", "name": "Song One", "artists": ["Artist A"], "duration_ms": 180000, "uri": "spotify:track:sp1"},
-        {"id": "sp2", "name": "Song Two", "artists": ["Artist B"], "duration_ms": 240000, "uri": "spotify:track:sp2"},
-    ]
+    mock_downloader.download.side_effect = _YTDLP_FAILURE
     sp_client = _make_sp_client(sp_tracks)
-    await sync_state_repo.set_json("sp_playlist_snapshot", ["sp1"])
+    await seed_snapshot("sp_playlist_snapshot", '["sp1"]')
 
     sync = SpToTgSync(
-        track_repo, sync_state_repo, sync_log_repo,
+        track_repo, sync_state_repo, noop_sync_log_repo,
         mock_tg_client, sp_client, mock_yt_client, mock_downloader,
     )
     result = await sync.process_new_tracks()
     assert result == 0
 
-    track = await track_repo.get_track_by_sp_track_id("sp2")
-    assert track is not None
-    assert track.status == "failed"
-    assert "download_failed" in track.failure_reason
+    assert "download_failed" in await first_failure_reason("sp_to_tg")
+    logged = [(args[0], kw["direction"]) for args, kw in noop_sync_log_repo.log.calls]
+    assert logged == [("download_failed", "sp_to_tg")]
@@ -42,3 +42,17 @@ def test_oauth_mode_builds_oauth_auth_manager(mock_spotify: MagicMock, tmp_path)
     auth_manager = mock_spotify.call_args.kwargs["auth_manager"]
     assert isinstance(auth_manager, SpotifyOAuth)
     assert auth_manager.client_id == "my_id"
+
+
+@patch("navaar.spotify.client.Spotify")
+def test_playlist_id_set_fetches_ids_only(mock_spotify: MagicMock, tmp_path) -> None:
+    sp = mock_spotify.return_value
+    sp.playlist_items.return_value = {
+        "items": [{"track": {"id": "sp1"}}, {"track": None}],
+        "next": "page2",
+    }
+    sp.next.return_value = {"items": [{"track": {"id": "sp2"}}], "next": None}
+    client = SpotifyClient(playlist_id="pl123", cache_path=str(tmp_path / ".spotify_cache"))
+
+    assert client.get_playlist_id_set() == frozenset({"sp1", "sp2"})
+    sp.playlist_items.assert_called_once_with("pl123", fields="items(track(id)),next")
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+from navaar.telegram.client import TelegramClient
+
+_URL = "https://api.telegram.org/file/botTOKEN/music/file_7.mp3"
+
+
+def _client(handler) -> TelegramClient:
+    tg_file = MagicMock(file_path=_URL, download_to_drive=AsyncMock())
+    bot = MagicMock(get_file=AsyncMock(return_value=tg_file))
+    client = TelegramClient(bot, channel_id=-100)
+    client._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+async def test_download_file_streams_to_disk(tmp_path) -> None:
+    payload = b"ID3" + b"\x00" * 200_000
+
+    client = _client(lambda request: httpx.Response(200, content=payload))
+    path = await client.download_file("FID", dest_dir=str(tmp_path))
+
+    assert path == str(tmp_path / "file_7.mp3")
+    assert (tmp_path / "file_7.mp3").read_bytes() == payload
+    client._bot.get_file.return_value.download_to_drive.assert_not_called()
+
+
+async def test_download_error_hides_token_url(tmp_path) -> None:
+    client = _client(lambda request: httpx.Response(404))
+    with pytest.raises(RuntimeError) as excinfo:
+        await client._stream_to_disk(_URL, str(tmp_path / "file_7.mp3"))
+    assert "TOKEN" not in str(excinfo.value)
+    assert "404" in str(excinfo.value)
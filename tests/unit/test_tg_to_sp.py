@@ -1,113 +1,100 @@
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from collections.abc import Awaitable, Callable
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 import pytest
 
-from navaar.db.repository import SyncLogRepository, TrackRepository
+from navaar.db.repository import TrackRepository
 from navaar.sync.tg_to_sp import TgToSpSync
 
 
-@pytest.fixture
-def mock_tg_client() -> MagicMock:
-    client = MagicMock()
-    client.download_file = AsyncMock(return_value="/tmp/test.mp3")
-    client.cleanup = MagicMock()
-    return client
-
-
-@pytest.mark.asyncio
 async def test_process_pending_no_tracks(
     track_repo: TrackRepository,
-    sync_log_repo: SyncLogRepository,
-    mock_tg_client: MagicMock,
-    mock_sp_client: MagicMock,
+    noop_sync_log_repo: SimpleNamespace,
+    mock_tg_client: SimpleNamespace,
+    mock_sp_client: SimpleNamespace,
 ) -> None:
-    sync = TgToSpSync(track_repo, sync_log_repo, mock_tg_client, mock_sp_client)
+    sync = TgToSpSync(track_repo, noop_sync_log_repo, mock_tg_client, mock_sp_client)
     result = await sync.process_pending()
     assert result == 0
 
 
-@pytest.mark.asyncio
-async def test_process_pending_syncs_track(
+# Each scenario: target-client methods to override (name -> return value), then
+# the Track fields expected once the pending track has been processed, then the
+# sync-log event it records, then the artist both Telegram and identification
+# report (None when neither could name one).
+_SCENARIOS = [
+    pytest.param(
+        {},
+        {"status": "synced", "sp_track_id": "sp123"},
+        "track_synced",
+        "Adele",
+        id="syncs_track",
+    ),
+    pytest.param(
+        {"find_best_match": None},
+        {"status": "failed", "failure_reason": "no_sp_match"},
+        "no_sp_match",
+        "Adele",
+        id="no_match",
+    ),
+    pytest.param(
+        {"find_best_match": None},
+        {"status": "failed", "failure_reason": "no_sp_match", "artist": None},
+        "no_sp_match",
+        None,
+        id="no_match_no_artist",
+    ),
+    pytest.param(
+        {"get_playlist_id_set": frozenset({"sp123"})},
+        {"status": "duplicate"},
+        "duplicate_skipped",
+        "Adele",
+        id="duplicate",
+    ),
+]
+
+
+@pytest.mark.parametrize(("target_returns", "expected", "event", "artist"), _SCENARIOS)
+async def test_process_pending(
     track_repo: TrackRepository,
-    sync_log_repo: SyncLogRepository,
-    mock_tg_client: MagicMock,
-    mock_sp_client: MagicMock,
+    noop_sync_log_repo: SimpleNamespace,
+    mock_tg_client: SimpleNamespace,
+    mock_sp_client: SimpleNamespace,
+    identify_stub: MagicMock,
+    target_returns: dict,
+    expected: dict,
+    event: str,
+    artist: str | None,
+    bulk_create_tracks: Callable[[list[dict]], Awaitable[list[int]]],
 ) -> None:
-    track = await track_repo.create_track(
-        direction="tg_to_sp",
-        status="pending",
-        title="Hello",
-        artist="Adele",
-        tg_file_id="file_123",
-    )
-
-    with patch("navaar.sync._base_push.identify_track") as mock_identify:
-        mock_identify.return_value = MagicMock(
-            artist="Adele", title="Hello", method="tg_metadata"
-        )
-        sync = TgToSpSync(track_repo, sync_log_repo, mock_tg_client, mock_sp_client)
-        result = await sync.process_pending()
-
-    assert result == 1
-    updated = await track_repo.get_track(track.id)
-    assert updated.status == "synced"
-    assert updated.sp_track_id == "sp123"
-
-
-@pytest.mark.asyncio
-async def test_process_pending_no_match(
-    track_repo: TrackRepository,
-    sync_log_repo: SyncLogRepository,
-    mock_tg_client: MagicMock,
-    mock_sp_client: MagicMock,
-) -> None:
-    mock_sp_client.find_best_match = MagicMock(return_value=None)
-
-    await track_repo.create_track(
-        direction="tg_to_sp",
-        status="pending",
-        title="asdfghjkl",
-        tg_file_id="file_456",
+    for name, value in target_returns.items():
+        setattr(mock_sp_client, name, MagicMock(return_value=value))
+
+    (track_id,) = await bulk_create_tracks([{
+        "direction": "tg_to_sp",
+        "status": "pending",
+        "title": "Hello",
+        "artist": artist,
+        "tg_file_id": "file_123",
+    }])
+
+    identify_stub.return_value = SimpleNamespace(
+        artist=artist, title="Hello", method="tg_metadata"
     )
+    sync = TgToSpSync(track_repo, noop_sync_log_repo, mock_tg_client, mock_sp_client)
+    result = await sync.process_pending()
 
-    with patch("navaar.sync._base_push.identify_track") as mock_identify:
-        mock_identify.return_value = MagicMock(
-            artist=None, title="asdfghjkl", method="filename"
-        )
-        sync = TgToSpSync(track_repo, sync_log_repo, mock_tg_client, mock_sp_client)
-        result = await sync.process_pending()
-
+    updated = await track_repo.get_track(track_id)
+    assert {field: getattr(updated, field) for field in expected} == expected
     assert result == 1
-    tracks = await track_repo.get_failed_tracks("tg_to_sp")
-    assert len(tracks) == 1
-    assert tracks[0].failure_reason == "no_sp_match"
-
-
-@pytest.mark.asyncio
-async def test_process_pending_duplicate(
-    track_repo: TrackRepository,
-    sync_log_repo: SyncLogRepository,
-    mock_tg_client: MagicMock,
-    mock_sp_client: MagicMock,
-) -> None:
-    mock_sp_client.is_in_playlist = MagicMock(return_value=True)
-
-    track = await track_repo.create_track(
-        direction="tg_to_sp",
-        status="pending",
-        title="Hello",
-        artist="Adele",
-        tg_file_id="file_789",
-    )
-
-    with patch("navaar.sync._base_push.identify_track") as mock_identify:
-        mock_identify.return_value = MagicMock(
-            artist="Adele", title="Hello", method="tg_metadata"
-        )
-        sync = TgToSpSync(track_repo, sync_log_repo, mock_tg_client, mock_sp_client)
-        await sync.process_pending()
-
-    updated = await track_repo.get_track(track.id)
-    assert updated.status == "duplicate"
+    logged = [(args[0], kw["direction"]) for args, kw in noop_sync_log_repo.log.calls]
+    assert logged == [(event, "tg_to_sp")]
+    if expected["status"] == "failed":
+        _, kw = noop_sync_log_repo.log.calls[0]
+        assert kw["details"] == {"artist": artist, "title": "Hello"}
+    # Only a fresh match is added; a duplicate is found in the playlist's id set.
+    added = [args[0] for args, _ in mock_sp_client.add_to_playlist.calls]
+    assert added == (["sp123"] if expected["status"] == "synced" else [])
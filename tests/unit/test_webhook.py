@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+from pydantic import ValidationError
+
+from navaar.api.server import TELEGRAM_WEBHOOK_PATH, create_app
+from navaar.config import Settings
+
+_UPDATE = {"update_id": 1, "channel_post": {"message_id": 5, "date": 0, "chat": {"id": -100, "type": "channel"}}}
+
+
+def _tg_app() -> MagicMock:
+    tg_app = MagicMock()
+    tg_app.update_queue = asyncio.Queue()
+    return tg_app
+
+
+def test_webhook_route_absent_without_telegram_app() -> None:
+    with TestClient(create_app()) as client:
+        resp = client.post(TELEGRAM_WEBHOOK_PATH, json=_UPDATE)
+    assert resp.status_code in (404, 405)
+
+
+def test_webhook_enqueues_update() -> None:
+    tg_app = _tg_app()
+    app = create_app(telegram_app=tg_app, telegram_webhook_secret="s3cret")
+    with TestClient(app) as client:
+        resp = client.post(
+            TELEGRAM_WEBHOOK_PATH,
+            json=_UPDATE,
+            headers={"X-Telegram-Bot-Api-Secret-Token": "s3cret"},
+        )
+    assert resp.status_code == 200
+    assert tg_app.update_queue.get_nowait().update_id == 1
+
+
+def test_webhook_rejects_wrong_secret() -> None:
+    tg_app = _tg_app()
+    app = create_app(telegram_app=tg_app, telegram_webhook_secret="s3cret")
+    with TestClient(app) as client:
+        resp = client.post(
+            TELEGRAM_WEBHOOK_PATH,
+            json=_UPDATE,
+            headers={"X-Telegram-Bot-Api-Secret-Token": "nope"},
+        )
+    assert resp.status_code == 403
+    assert tg_app.update_queue.empty()
+
+
+@pytest.mark.parametrize("headers", [{}, {"X-Telegram-Bot-Api-Secret-Token": ""}])
+def test_webhook_rejects_missing_or_empty_secret(headers: dict) -> None:
+    tg_app = _tg_app()
+    app = create_app(telegram_app=tg_app, telegram_webhook_secret="s3cret")
+    with TestClient(app) as client:
+        resp = client.post(TELEGRAM_WEBHOOK_PATH, json=_UPDATE, headers=headers)
+    assert resp.status_code == 403
+    assert tg_app.update_queue.empty()
+
+
+def test_webhook_without_configured_secret_rejects_everything() -> None:
+    tg_app = _tg_app()
+    app = create_app(telegram_app=tg_app)
+    with TestClient(app) as client:
+        resp = client.post(
+            TELEGRAM_WEBHOOK_PATH,
+            json=_UPDATE,
+            headers={"X-Telegram-Bot-Api-Secret-Token": ""},
+        )
+    assert resp.status_code == 403
+    assert tg_app.update_queue.empty()
+
+
+def test_settings_require_secret_with_webhook_url() -> None:
+    with pytest.raises(ValidationError, match="WEBHOOK_SECRET_TOKEN"):
+        Settings(
+            _env_file=None,
+            telegram_bot_token="t",
+            telegram_webhook_url="https://example.com/telegram/webhook",
+        )
+
+
+@pytest.mark.parametrize(
+    "body", [b"not json", b"[1, 2]", b'"update"', b"{}"], ids=["not_json", "array", "string", "no_update_id"]
+)
+def test_webhook_rejects_malformed_body(body: bytes) -> None:
+    tg_app = _tg_app()
+    app = create_app(telegram_app=tg_app, telegram_webhook_secret="s3cret")
+    with TestClient(app) as client:
+        resp = client.post(
+            TELEGRAM_WEBHOOK_PATH,
+            content=body,
+            headers={"X-Telegram-Bot-Api-Secret-Token": "s3cret", "Content-Type": "application/json"},
+        )
+    assert resp.status_code == 400
+    assert tg_app.update_queue.empty()
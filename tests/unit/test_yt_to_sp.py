@@ -1,99 +1,78 @@
 from __future__ import annotations
 
+from collections.abc import Awaitable, Callable
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 import pytest
 
-from navaar.db.repository import SyncLogRepository, TrackRepository
+from navaar.db.repository import TrackRepository
 from navaar.sync.yt_to_sp import YtToSpSync
 
 
-@pytest.fixture
-def mock_yt_client() -> MagicMock:
-    client = MagicMock()
-    return client
-
-
-@pytest.mark.asyncio
 async def test_process_pending_no_tracks(
     track_repo: TrackRepository,
-    sync_log_repo: SyncLogRepository,
-    mock_yt_client: MagicMock,
-    mock_sp_client: MagicMock,
+    noop_sync_log_repo: SimpleNamespace,
+    mock_yt_client: SimpleNamespace,
+    mock_sp_client: SimpleNamespace,
 ) -> None:
-    sync = YtToSpSync(track_repo, sync_log_repo, mock_yt_client, mock_sp_client)
+    sync = YtToSpSync(track_repo, noop_sync_log_repo, mock_yt_client, mock_sp_client)
     result = await sync.process_pending()
     assert result == 0
 
 
-@pytest.mark.asyncio
-async def test_process_pending_syncs_track(
+# Each scenario: target-client methods to override (name -> return value), then
+# the Track fields expected once the pending track has been processed, then the
+# sync-log event it records.
+_SCENARIOS = [
+    pytest.param(
+        {}, {"status": "synced", "sp_track_id": "sp123"}, "track_synced", id="syncs_track"
+    ),
+    pytest.param(
+        {"find_best_match": None},
+        {"status": "failed", "failure_reason": "no_sp_match"},
+        "no_sp_match",
+        id="no_match",
+    ),
+    pytest.param(
+        {"get_playlist_id_set": frozenset({"sp123"})},
+        {"status": "duplicate"},
+        "duplicate_skipped",
+        id="duplicate",
+    ),
+]
+
+
+@pytest.mark.parametrize(("target_returns", "expected", "event"), _SCENARIOS)
+async def test_process_pending(
     track_repo: TrackRepository,
-    sync_log_repo: SyncLogRepository,
-    mock_yt_client: MagicMock,
-    mock_sp_client: MagicMock,
+    noop_sync_log_repo: SimpleNamespace,
+    mock_yt_client: SimpleNamespace,
+    mock_sp_client: SimpleNamespace,
+    target_returns: dict,
+    expected: dict,
+    event: str,
+    bulk_create_tracks: Callable[[list[dict]], Awaitable[list[int]]],
 ) -> None:
-    track = await track_repo.create_track(
-        direction="yt_to_sp",
-        status="pending",
-        title="Hello",
-        artist="Adele",
-        yt_video_id="abc123",
-    )
-
-    sync = YtToSpSync(track_repo, sync_log_repo, mock_yt_client, mock_sp_client)
+    for name, value in target_returns.items():
+        setattr(mock_sp_client, name, MagicMock(return_value=value))
+
+    (track_id,) = await bulk_create_tracks([{
+        "direction": "yt_to_sp",
+        "status": "pending",
+        "title": "Hello",
+        "artist": "Adele",
+        "yt_video_id": "abc123",
+    }])
+
+    sync = YtToSpSync(track_repo, noop_sync_log_repo, mock_yt_client, mock_sp_client)
     result = await sync.process_pending()
 
+    updated = await track_repo.get_track(track_id)
+    assert {field: getattr(updated, field) for field in expected} == expected
     assert result == 1
-    updated = await track_repo.get_track(track.id)
-    assert updated.status == "synced"
-    assert updated.sp_track_id == "sp123"
-
-
-@pytest.mark.asyncio
-async def test_process_pending_no_match(
-    track_repo: TrackRepository,
-    sync_log_repo: SyncLogRepository,
-    mock_yt_client: MagicMock,
-    mock_sp_client: MagicMock,
-) -> None:
-    mock_sp_client.find_best_match = MagicMock(return_value=None)
-
-    await track_repo.create_track(
-        direction="yt_to_sp",
-        status="pending",
-        title="asdfghjkl",
-        yt_video_id="xyz789",
-    )
-
-    sync = YtToSpSync(track_repo, sync_log_repo, mock_yt_client, mock_sp_client)
-    result = await sync.process_pending()
-
-    assert result == 1
-    tracks = await track_repo.get_failed_tracks("yt_to_sp")
-    assert len(tracks) == 1
-    assert tracks[0].failure_reason == "no_sp_match"
-
-
-@pytest.mark.asyncio
-async def test_process_pending_duplicate(
-    track_repo: TrackRepository,
-    sync_log_repo: SyncLogRepository,
-    mock_yt_client: MagicMock,
-    mock_sp_client: MagicMock,
-) -> None:
-    mock_sp_client.is_in_playlist = MagicMock(return_value=True)
-
-    track = await track_repo.create_track(
-        direction="yt_to_sp",
-        status="pending",
-        title="Hello",
-        artist="Adele",
-        yt_video_id="abc123",
-    )
-
-    sync = YtToSpSync(track_repo, sync_log_repo, mock_yt_client, mock_sp_client)
-    await sync.process_pending()
-
-    updated = await track_repo.get_track(track.id)
-    assert updated.status == "duplicate"
+    logged = [(args[0], kw["direction"]) for args, kw in noop_sync_log_repo.log.calls]
+    assert logged == [(event, "yt_to_sp")]
+    # Only a fresh match is added; a duplicate is found in the playlist's id set.
+    added = [args[0] for args, _ in mock_sp_client.add_to_playlist.calls]
+    assert added == (["sp123"] if expected["status"] == "synced" else [])
@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import asyncio
+import itertools
+from collections.abc import Awaitable, Callable
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -7,60 +11,47 @@ import pytest
 from navaar.db.repository import SyncLogRepository, SyncStateRepository, TrackRepository
 from navaar.sync.yt_to_tg import YtToTgSync
 
-
-@pytest.fixture
-def mock_tg_client() -> MagicMock:
-    client = MagicMock()
-    client.send_audio = AsyncMock(side_effect=[42, 43, 44, 45])
-    return client
+# Built once per module; each test gets its own list (the sync code only reads
+# the item dicts) on a fresh mock, so call records never leak between tests.
+_YT_PLAYLIST = (
+    {
+        "videoId": "vid1",
+        "title": "Song One",
+        "artists": [{"name": "Artist A"}],
+        "duration_seconds": 180,
+        "setVideoId": "set1",
+    },
+    {
+        "videoId": "vid2",
+        "title": "Song Two",
+        "artists": [{"name": "Artist B"}],
+        "duration_seconds": 240,
+        "setVideoId": "set2",
+    },
+)
+_YTDLP_FAILURE = RuntimeError("yt-dlp failed")
 
 
 @pytest.fixture
-def mock_yt_client() -> MagicMock:
-    client = MagicMock()
-    client.get_playlist_tracks = MagicMock(
-        return_value=[
-            {
-                "videoId": "vid1",
-                "title": "Song One",
-                "artists": [{"name": "Artist A"}],
-                "duration_seconds": 180,
-                "setVideoId": "set1",
-            },
-            {
-                "videoId": "vid2",
-                "title": "Song Two",
-                "artists": [{"name": "Artist B"}],
-                "duration_seconds": 240,
-                "setVideoId": "set2",
-            },
-        ]
-    )
-    return client
+def mock_yt_client(mock_yt_client: SimpleNamespace) -> SimpleNamespace:
+    mock_yt_client.get_playlist_tracks = MagicMock(return_value=list(_YT_PLAYLIST))
+    return mock_yt_client
 
 
-@pytest.fixture
-def mock_downloader() -> MagicMock:
-    dl = MagicMock()
-    dl.download = AsyncMock(return_value="/tmp/vid1.mp3")
-    dl.cleanup = MagicMock()
-    return dl
-
-
-@pytest.mark.asyncio
 async def test_no_new_tracks(
     track_repo: TrackRepository,
     sync_state_repo: SyncStateRepository,
-    sync_log_repo: SyncLogRepository,
-    mock_tg_client: MagicMock,
-    mock_yt_client: MagicMock,
-    mock_downloader: MagicMock,
+    noop_sync_log_repo: SimpleNamespace,
+    seed_snapshot: Callable[[str, str], Awaitable[None]],
+    mock_tg_client: SimpleNamespace,
+    mock_yt_client: SimpleNamespace,
+    mock_downloader: SimpleNamespace,
 ) -> None:
     # Pre-populate snapshot with all tracks
-    await sync_state_repo.set_json("yt_playlist_snapshot", ["vid1", "vid2"])
+    await seed_snapshot("yt_playlist_snapshot", '["vid1", "vid2"]')
 
     sync = YtToTgSync(
-        track_repo, sync_state_repo, sync_log_repo,
+        track_repo, sync_state_repo, noop_sync_log_repo,
         mock_tg_client, mock_yt_client, mock_downloader,
     )
     result = await sync.process_new_tracks()
@@ -68,20 +59,20 @@ async def test_no_new_tracks(
     mock_downloader.download.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_new_track_synced(
     track_repo: TrackRepository,
     sync_state_repo: SyncStateRepository,
-    sync_log_repo: SyncLogRepository,
-    mock_tg_client: MagicMock,
-    mock_yt_client: MagicMock,
-    mock_downloader: MagicMock,
+    noop_sync_log_repo: SimpleNamespace,
+    seed_snapshot: Callable[[str, str], Awaitable[None]],
+    mock_tg_client: SimpleNamespace,
+    mock_yt_client: SimpleNamespace,
+    mock_downloader: SimpleNamespace,
 ) -> None:
     # Snapshot only has vid1, so vid2 is new
-    await sync_state_repo.set_json("yt_playlist_snapshot", ["vid1"])
+    await seed_snapshot("yt_playlist_snapshot", '["vid1"]')
 
     sync = YtToTgSync(
-        track_repo, sync_state_repo, sync_log_repo,
+        track_repo, sync_state_repo, noop_sync_log_repo,
         mock_tg_client, mock_yt_client, mock_downloader,
     )
     result = await sync.process_new_tracks()
@@ -96,21 +87,22 @@ async def test_new_track_synced(
     mock_downloader.download.assert_called_once_with("vid2")
     mock_tg_client.send_audio.assert_called_once()
     mock_downloader.cleanup.assert_called_once()
+    logged = [(args[0], kw["direction"]) for args, kw in noop_sync_log_repo.log.calls]
+    assert logged == [("track_synced", "yt_to_tg")]
 
 
-@pytest.mark.asyncio
 async def test_first_run_empty_snapshot(
     track_repo: TrackRepository,
     sync_state_repo: SyncStateRepository,
-    sync_log_repo: SyncLogRepository,
-    mock_tg_client: MagicMock,
-    mock_yt_client: MagicMock,
-    mock_downloader: MagicMock,
+    noop_sync_log_repo: SimpleNamespace,
+    mock_tg_client_multi: SimpleNamespace,
+    mock_yt_client: SimpleNamespace,
+    mock_downloader: SimpleNamespace,
 ) -> None:
     # No snapshot at all — all tracks are "new"
     sync = YtToTgSync(
-        track_repo, sync_state_repo, sync_log_repo,
-        mock_tg_client, mock_yt_client, mock_downloader,
+        track_repo, sync_state_repo, noop_sync_log_repo,
+        mock_tg_client_multi, mock_yt_client, mock_downloader,
     )
     result = await sync.process_new_tracks()
     assert result == 2
@@ -120,27 +112,162 @@ async def test_first_run_empty_snapshot(
     assert snapshot == ["vid1", "vid2"]
 
 
-@pytest.mark.asyncio
 async def test_download_failure_marks_failed(
     track_repo: TrackRepository,
     sync_state_repo: SyncStateRepository,
-    sync_log_repo: SyncLogRepository,
-    mock_tg_client: MagicMock,
-    mock_yt_client: MagicMock,
-    mock_downloader: MagicMock,
+    noop_sync_log_repo: SimpleNamespace,
+    seed_snapshot: Callable[[str, str], Awaitable[None]],
+    first_failure_reason: Callable[[str], Awaitable[str | None]],
+    mock_tg_client: SimpleNamespace,
+    mock_yt_client: SimpleNamespace,
+    mock_downloader: SimpleNamespace,
 ) -> None:
-    mock_downloader.download = AsyncMock(side_effect=RuntimeError("yt-dlp failed"))
-    await sync_state_repo.set_json("yt_playlist_snapshot", ["vid1"])
+    mock_downloader.download.side_effect = _YTDLP_FAILURE
+    await seed_snapshot("yt_playlist_snapshot", '["vid1"]')
 
     sync = YtToTgSync(
-        track_repo, sync_state_repo, sync_log_repo,
+        track_repo, sync_state_repo, noop_sync_log_repo,
         mock_tg_client, mock_yt_client, mock_downloader,
     )
     result = await sync.process_new_tracks()
     # Track creation and attempt still counts, but sync fails
     assert result == 0
 
-    track = await track_repo.get_track_by_yt_video_id("vid2")
-    assert track is not None
-    assert track.status == "failed"
-    assert "download_failed" in track.failure_reason
+    assert "download_failed" in await first_failure_reason("yt_to_tg")
+    logged = [(args[0], kw["direction"]) for args, kw in noop_sync_log_repo.log.calls]
+    assert logged == [("download_failed", "yt_to_tg")]
+
+
+async def test_new_tracks_batch_downloaded_in_one_run(
+    track_repo: TrackRepository,
+    sync_state_repo: SyncStateRepository,
+    noop_sync_log_repo: SimpleNamespace,
+    mock_tg_client_multi: SimpleNamespace,
+    mock_yt_client: SimpleNamespace,
+    mock_downloader: SimpleNamespace,
+) -> None:
+    mock_downloader.download_many = AsyncMock(
+        return_value={"vid1": "/tmp/vid1.mp3", "vid2": "/tmp/vid2.mp3"}
+    )
+    sync = YtToTgSync(
+        track_repo, sync_state_repo, noop_sync_log_repo,
+        mock_tg_client_multi, mock_yt_client, mock_downloader,
+    )
+    assert await sync.process_new_tracks() == 2
+
+    mock_downloader.download_many.assert_awaited_once_with(["vid1", "vid2"])
+    mock_downloader.download.assert_not_called()
+    uploaded = [kw["file_path"] for _, kw in mock_tg_client_multi.send_audio.calls]
+    assert uploaded == ["/tmp/vid1.mp3", "/tmp/vid2.mp3"]
+
+
+async def test_new_tracks_prefetched_one_window_at_a_time(
+    track_repo: TrackRepository,
+    sync_state_repo: SyncStateRepository,
+    noop_sync_log_repo: SimpleNamespace,
+    mock_tg_client: SimpleNamespace,
+    mock_yt_client: SimpleNamespace,
+    mock_downloader: SimpleNamespace,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("navaar.sync._base_pull._PREFETCH_WINDOW", 2)
+    vids = ["v1", "v2", "v3", "v4"]
+    mock_yt_client.get_playlist_tracks = MagicMock(
+        return_value=[{"videoId": v, "title": v, "artists": []} for v in vids]
+    )
+    events: list[tuple[str, object]] = []
+
+    async def download_many(video_ids: list[str]) -> dict[str, str]:
+        events.append(("prefetch", video_ids))
+        return {v: f"/tmp/{v}.mp3" for v in video_ids}
+
+    async def send_audio(*, file_path: str, **_: object) -> int:
+        events.append(("upload", file_path))
+        return len(events)
+
+    mock_downloader.download_many = AsyncMock(side_effect=download_many)
+    mock_tg_client.send_audio = AsyncMock(side_effect=send_audio)
+    sync = YtToTgSync(
+        track_repo, sync_state_repo, noop_sync_log_repo,
+        mock_tg_client, mock_yt_client, mock_downloader,
+    )
+    assert await sync.process_new_tracks() == 4
+
+    assert events == [
+        ("prefetch", ["v1", "v2"]),
+        ("upload", "/tmp/v1.mp3"),
+        ("upload", "/tmp/v2.mp3"),
+        ("prefetch", ["v3", "v4"]),
+        ("upload", "/tmp/v3.mp3"),
+        ("upload", "/tmp/v4.mp3"),
+    ]
+
+
+async def test_retries_run_concurrently(
+    engine_session_factory,
+    mock_tg_client_multi: SimpleNamespace,
+    mock_yt_client: SimpleNamespace,
+    mock_downloader: SimpleNamespace,
+) -> None:
+    track_repo = TrackRepository(engine_session_factory)
+    sync_state_repo = SyncStateRepository(engine_session_factory)
+    sync_log_repo = SyncLogRepository(engine_session_factory)
+    await sync_state_repo.set_json("yt_playlist_snapshot", ["vid1", "vid2"])
+    for vid in ("r1", "r2"):
+        await track_repo.create_track(
+            direction="yt_to_tg", status="retry_scheduled", title=vid, yt_video_id=vid
+        )
+
+    both_started = asyncio.Event()
+    started: list[str] = []
+
+    async def download(video_id: str) -> str:
+        started.append(video_id)
+        if len(started) == 2:
+            both_started.set()
+        # Only returns once the other retry is downloading too.
+        await asyncio.wait_for(both_started.wait(), 1.0)
+        return f"/tmp/{video_id}.mp3"
+
+    mock_downloader.download = AsyncMock(side_effect=download)
+    sync = YtToTgSync(
+        track_repo, sync_state_repo, sync_log_repo,
+        mock_tg_client_multi, mock_yt_client, mock_downloader,
+    )
+    assert await sync.process_new_tracks() == 2
+    assert sorted(started) == ["r1", "r2"]
+
+
+async def test_retries_in_flight_are_bounded(
+    engine_session_factory,
+    mock_tg_client_multi: SimpleNamespace,
+    mock_yt_client: SimpleNamespace,
+    mock_downloader: SimpleNamespace,
+) -> None:
+    track_repo = TrackRepository(engine_session_factory)
+    sync_state_repo = SyncStateRepository(engine_session_factory)
+    sync_log_repo = SyncLogRepository(engine_session_factory)
+    await sync_state_repo.set_json("yt_playlist_snapshot", ["vid1", "vid2"])
+    for vid in ("r1", "r2", "r3", "r4"):
+        await track_repo.create_track(
+            direction="yt_to_tg", status="retry_scheduled", title=vid, yt_video_id=vid
+        )
+    running = peak = 0
+    message_ids = itertools.count(42)
+
+    async def send_audio(**_: object) -> int:
+        # The upload isn't behind the downloader's semaphore, only the retry cap.
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return next(message_ids)
+
+    mock_tg_client_multi.send_audio = AsyncMock(side_effect=send_audio)
+    sync = YtToTgSync(
+        track_repo, sync_state_repo, sync_log_repo,
+        mock_tg_client_multi, mock_yt_client, mock_downloader, max_concurrent=2,
+    )
+    assert await sync.process_new_tracks() == 4
+    assert peak == 2
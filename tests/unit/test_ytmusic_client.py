@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import json
+import time
+
+import httpx
+
+from navaar.ytmusic.client import _PLAYLIST_ID_FIELDS, YT_API_BASE, YTMusicClient
+
+# These build the REAL YTMusicClient against a token file that is still fresh (so
+# construction doesn't hit the OAuth endpoint) and swap its pooled httpx client's
+# transport for a MockTransport, so requests are served locally.
+
+
+def _make_client(tmp_path, handler, expires_in: int = 3600) -> YTMusicClient:
+    auth = tmp_path / "oauth.json"
+    auth.write_text(json.dumps({
+        "access_token": "tok1",
+        "refresh_token": "refresh",
+        "expires_at": int(time.time()) + expires_in,
+    }))
+    client = YTMusicClient(
+        auth_file=str(auth), playlist_id="PL1", client_id="cid", client_secret="sec"
+    )
+    client._http = httpx.Client(
+        base_url=YT_API_BASE,
+        headers=client._http.headers,
+        transport=httpx.MockTransport(handler),
+    )
+    return client
+
+
+def test_requests_share_pooled_client_with_bearer(tmp_path) -> None:
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"items": [
+            {"id": {"videoId": "v1"}, "snippet": {"title": "Hello", "channelTitle": "Adele"}},
+        ]})
+
+    client = _make_client(tmp_path, handler)
+    results = client.search_song("adele hello", limit=1)
+
+    assert results == [{"videoId": "v1", "title": "Hello", "artists": [{"name": "Adele"}]}]
+    assert str(seen[0].url).startswith(f"{YT_API_BASE}/search?")
+    assert seen[0].headers["Authorization"] == "Bearer tok1"
+
+
+def test_get_playlist_tracks_follows_page_tokens(tmp_path) -> None:
+    def item(vid: str) -> dict:
+        return {
+            "id": f"pi_{vid}",
+            "snippet": {
+                "title": vid,
+                "videoOwnerChannelTitle": "Ch",
+                "resourceId": {"videoId": vid},
+            },
+        }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.params.get("pageToken") == "p2":
+            return httpx.Response(200, json={"items": [item("v2")]})
+        return httpx.Response(200, json={"items": [item("v1")], "nextPageToken": "p2"})
+
+    client = _make_client(tmp_path, handler)
+    tracks = client.get_playlist_tracks()
+
+    assert [t["videoId"] for t in tracks] == ["v1", "v2"]
+    assert tracks[1]["setVideoId"] == "pi_v2"
+
+
+def test_playlist_requests_use_partial_response(tmp_path) -> None:
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"items": []})
+
+    client = _make_client(tmp_path, handler)
+    client.get_playlist_tracks()
+    fields = seen[0].url.params["fields"]
+    assert fields.startswith("nextPageToken,")
+    assert "resourceId/videoId" in fields
+
+
+def test_refresh_only_when_near_expiry_and_persists(tmp_path, monkeypatch) -> None:
+    posts: list[dict] = []
+
+    def fake_post(url, data=None, **kwargs):
+        posts.append(data)
+        return httpx.Response(
+            200,
+            json={"access_token": "tok2", "expires_in": 3600},
+            request=httpx.Request("POST", url),
+        )
+
+    monkeypatch.setattr("navaar.ytmusic.client.httpx.post", fake_post)
+    client = _make_client(tmp_path, lambda r: httpx.Response(200, json={}), expires_in=3600)
+    assert client.get_access_token() == "tok1"
+    assert posts == []
+
+    client._expires_at = time.time()  # inside the 60s refresh window
+    assert client.get_access_token() == "tok2"
+    assert len(posts) == 1
+    assert client._http.headers["Authorization"] == "Bearer tok2"
+    saved = json.loads((tmp_path / "oauth.json").read_text())
+    assert saved["access_token"] == "tok2"
+    assert client._expires_at == float(saved["expires_at"])
+
+
+def test_concurrent_callers_share_one_refresh(tmp_path, monkeypatch) -> None:
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    posts: list[dict] = []
+    gate = threading.Event()
+
+    def slow_post(url, data=None, **kwargs):
+        posts.append(data)
+        gate.wait(1)
+        return httpx.Response(
+            200,
+            json={"access_token": "tok2", "expires_in": 3600},
+            request=httpx.Request("POST", url),
+        )
+
+    monkeypatch.setattr("navaar.ytmusic.client.httpx.post", slow_post)
+    client = _make_client(tmp_path, lambda r: httpx.Response(200, json={}))
+    client._expires_at = 0.0
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(client.get_access_token) for _ in range(4)]
+        gate.set()
+        tokens = [f.result() for f in futures]
+
+    assert tokens == ["tok2"] * 4
+    assert len(posts) == 1
+
+
+def test_is_in_playlist_uses_id_set(tmp_path) -> None:
+    client = _make_client(tmp_path, lambda r: httpx.Response(500))  # must not fetch
+    ids = frozenset({"v1", "v2"})
+    assert client.is_in_playlist("v2", playlist_ids=ids)
+    assert not client.is_in_playlist("v3", playlist_ids=ids)
+    assert client.is_in_playlist("v1", playlist_tracks=[{"videoId": "v1"}])
+
+
+def test_playlist_id_set_fetches_ids_only(tmp_path) -> None:
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        if "pageToken" not in request.url.params:
+            return httpx.Response(200, json={"nextPageToken": "p2", "items": [
+                {"snippet": {"resourceId": {"videoId": "v1"}}},
+                {"snippet": {"resourceId": {"videoId": "v2"}}},
+            ]})
+        return httpx.Response(200, json={"items": [{"snippet": {"resourceId": {"videoId": "v3"}}}]})
+
+    client = _make_client(tmp_path, handler)
+    assert client.get_playlist_id_set() == frozenset({"v1", "v2", "v3"})
+    # Every page, not just the first, carries the id-only mask.
+    assert [r.url.params["fields"] for r in seen] == [_PLAYLIST_ID_FIELDS] * 2
+    assert seen[1].url.params["pageToken"] == "p2"